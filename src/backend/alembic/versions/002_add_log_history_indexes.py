@@ -0,0 +1,34 @@
+"""Add composite indexes for log and history listings.
+
+Revision ID: 002_add_log_history_indexes
+Revises: 001_add_scheduled_deletion
+Create Date: 2026-10-16
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "002_add_log_history_indexes"
+down_revision = "001_add_scheduled_deletion"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Replace the single-column level/status indexes with created_at composites."""
+    # The composites lead with level/status, so they also serve the queries
+    # the single-column indexes did
+    op.create_index("ix_logs_level_source_created_at", "logs", ["level", "source", "created_at"])
+    op.drop_index("ix_logs_level", table_name="logs")
+
+    op.create_index("ix_history_status_created_at", "history", ["status", "created_at"])
+    op.drop_index("ix_history_status", table_name="history")
+
+
+def downgrade() -> None:
+    """Restore the single-column level/status indexes."""
+    op.create_index("ix_history_status", "history", ["status"])
+    op.drop_index("ix_history_status_created_at", table_name="history")
+
+    op.create_index("ix_logs_level", "logs", ["level"])
+    op.drop_index("ix_logs_level_source_created_at", table_name="logs")
@@ -67,7 +67,8 @@ async def get_tunarr_channels(db: AsyncSession = Depends(get_db)):
 
     try:
         integration = TunarrIntegration(url=url, api_key=api_key)
-        channels = await integration.get_channels()
+        # The settings UI should reflect channel changes immediately
+        channels = await integration.get_channels(use_cache=False)
         await integration.close()
 
         return [
@@ -10,6 +10,8 @@ from datetime import datetime
 from typing import Any
 from uuid import uuid4
 
+from sqlalchemy import insert
+
 from app.config import settings
 
 # Context variable for correlation ID
@@ -157,7 +159,7 @@ class DatabaseLogHandler(logging.Handler):
         logging.CRITICAL: "error",  # Map critical to error
     }
 
-    def __init__(self, level: int = logging.INFO, batch_size: int = 10, flush_interval: float = 2.0):
+    def __init__(self, level: int = logging.INFO, batch_size: int = 200, flush_interval: float = 2.0):
         super().__init__(level)
         self._queue: queue.Queue = queue.Queue(maxsize=1000)  # Limit queue size
         self._thread: threading.Thread | None = None
@@ -209,14 +211,25 @@ class DatabaseLogHandler(logging.Handler):
                 try:
                     # Try to get a record with short timeout
                     record = self._queue.get(timeout=0.5)
+                    if record is not None:
+                        batch.append(record)
+                        # Drain what is already queued so a burst of logs goes
+                        # out in one INSERT instead of one batch per wake-up
+                        while len(batch) < self._batch_size:
+                            try:
+                                record = self._queue.get_nowait()
+                            except queue.Empty:
+                                break
+                            if record is None:
+                                break
+                            batch.append(record)
+
                     if record is None:  # Shutdown signal
                         # Flush remaining logs
                         if batch:
                             loop.run_until_complete(self._write_logs_batch(batch))
                         break
 
-                    batch.append(record)
-
                     # Flush if batch is full or interval elapsed
                     current_time = time.time()
                     if len(batch) >= self._batch_size or (current_time - last_flush) >= self._flush_interval:
@@ -276,9 +289,10 @@ class DatabaseLogHandler(logging.Handler):
             from app.database import AsyncSessionLocal
             from app.models.log import Log
 
+            # Bulk INSERT with one parameter set per record, without building
+            # ORM objects (id/created_at column defaults still apply)
             async with AsyncSessionLocal() as session:
-                logs = [Log(**self._record_to_log_params(r)) for r in records]
-                session.add_all(logs)
+                await session.execute(insert(Log), [self._record_to_log_params(r) for r in records])
                 await session.commit()
 
         except Exception:
@@ -1,10 +1,14 @@
 """Base integration class for external services."""
 
+import asyncio
 import time
 from abc import ABC, abstractmethod
+from contextlib import nullcontext
 from typing import Any, Generic, TypeVar
 
 import httpx
+import orjson
+from httpx._utils import get_environment_proxies
 
 from app.core.exceptions import IntegrationError
 from app.core.logging import get_logger
@@ -14,6 +18,58 @@ T = TypeVar("T")
 logger = get_logger(__name__)
 
 
+class _SharedTransport(httpx.AsyncHTTPTransport):
+    """Connection pool shared by all integration clients.
+
+    Integration clients are short-lived (created per operation and closed
+    afterwards), so closing a client must not drop the pooled connections.
+    """
+
+    async def aclose(self) -> None:
+        """Keep the pool open when a client closes; see close_shared_transport."""
+
+    async def __aexit__(self, *args: Any) -> None:
+        """Keep the pool open when a client is used as a context manager."""
+
+    async def shutdown(self) -> None:
+        """Close the pooled connections."""
+        await super().aclose()
+
+
+# One pool for direct connections (key None) and one per proxy URL
+_shared_transports: dict[str | None, _SharedTransport] = {}
+
+
+def _get_shared_transport(proxy: str | None = None) -> _SharedTransport:
+    """Get or create the shared connection pool for direct or proxied connections."""
+    transport = _shared_transports.get(proxy)
+    if transport is None:
+        transport = _SharedTransport(limits=BaseIntegration.HTTP_LIMITS, proxy=proxy)
+        _shared_transports[proxy] = transport
+    return transport
+
+
+def _get_shared_mounts() -> dict[str, httpx.AsyncBaseTransport | None]:
+    """Route requests through the environment's proxies (HTTP_PROXY, NO_PROXY, ...).
+
+    httpx ignores environment proxies when a client is given an explicit
+    transport, so they are mounted here the way httpx would; None mounts
+    (NO_PROXY hosts) fall back to the direct pool.
+    """
+    return {
+        pattern: None if proxy is None else _get_shared_transport(proxy)
+        for pattern, proxy in get_environment_proxies().items()
+    }
+
+
+async def close_shared_transport() -> None:
+    """Close the connection pools shared by integration clients (on shutdown)."""
+    transports = list(_shared_transports.values())
+    _shared_transports.clear()
+    for transport in transports:
+        await transport.shutdown()
+
+
 class BaseIntegration(ABC, Generic[T]):
     """Abstract base class for external service integrations."""
 
@@ -21,17 +77,31 @@ class BaseIntegration(ABC, Generic[T]):
     DEFAULT_TIMEOUT: int = 30
     MAX_RETRIES: int = 3
     RETRY_DELAY: float = 1.0
+    # Keep-alive pool shared by every integration client (all services)
+    HTTP_LIMITS = httpx.Limits(
+        max_keepalive_connections=20,
+        max_connections=100,
+        keepalive_expiry=30,
+    )
+    # Cap on simultaneous requests per instance, for services queried in
+    # bursts (None means unbounded)
+    MAX_CONCURRENT_REQUESTS: int | None = None
 
     def __init__(self, url: str, api_key: str):
         """Initialize integration with URL and API key."""
         self.url = url.rstrip("/") if url else ""
         self.api_key = api_key or ""
         self._client: httpx.AsyncClient | None = None
+        limit = self.MAX_CONCURRENT_REQUESTS
+        self._semaphore = asyncio.Semaphore(limit) if limit else None
+        # Credentials are fixed for the lifetime of an instance, so the
+        # configuration check is computed once instead of on every call.
+        self._configured = bool(self.url and self.api_key)
 
     @property
     def is_configured(self) -> bool:
         """Check if integration has required configuration."""
-        return bool(self.url and self.api_key)
+        return self._configured
 
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create HTTP client."""
@@ -39,6 +109,8 @@ class BaseIntegration(ABC, Generic[T]):
             self._client = httpx.AsyncClient(
                 base_url=self.url,
                 timeout=httpx.Timeout(self.DEFAULT_TIMEOUT),
+                transport=_get_shared_transport(),
+                mounts=_get_shared_mounts(),
                 headers=self._get_default_headers(),
             )
         return self._client
@@ -64,14 +136,16 @@ class BaseIntegration(ABC, Generic[T]):
 
         for attempt in range(self.MAX_RETRIES):
             try:
-                start_time = time.time()
-                response = await client.request(
-                    method=method,
-                    url=path,
-                    params=params,
-                    json=json,
-                    **kwargs,
-                )
+                # Only the request itself holds a slot, not the retry backoff
+                async with self._semaphore or nullcontext():
+                    start_time = time.time()
+                    response = await client.request(
+                        method=method,
+                        url=path,
+                        params=params,
+                        json=json,
+                        **kwargs,
+                    )
                 elapsed_ms = int((time.time() - start_time) * 1000)
 
                 logger.debug(
@@ -79,7 +153,8 @@ class BaseIntegration(ABC, Generic[T]):
                 )
 
                 response.raise_for_status()
-                return response.json() if response.content else {}
+                content = response.content
+                return orjson.loads(content) if content else {}
 
             except httpx.HTTPStatusError as e:
                 last_error = e
@@ -100,9 +175,13 @@ class BaseIntegration(ABC, Generic[T]):
                 logger.debug(f"Retrying in {delay}s (attempt {attempt + 2}/{self.MAX_RETRIES})")
                 await self._sleep(delay)
 
+        details = None
+        if isinstance(last_error, httpx.HTTPStatusError):
+            details = {"status_code": last_error.response.status_code}
         raise IntegrationError(
             service=self.SERVICE_NAME,
             message=str(last_error) if last_error else "Request failed",
+            details=details,
         )
 
     async def _sleep(self, seconds: float) -> None:
@@ -143,14 +143,14 @@ class GhostIntegration(BaseIntegration[GhostNewsletter]):
             images = result.get("images", [])
             if images:
                 url = images[0].get("url")
-                logger.debug(f"Image uploaded to Ghost: {url}")
+                logger.debug("Image uploaded to Ghost: %s", url)
                 return url
 
             logger.warning("Ghost image upload returned no images")
             return None
 
         except Exception as e:
-            logger.warning(f"Failed to upload image to Ghost: {e}")
+            logger.warning("Failed to upload image to Ghost: %s", e)
             return None
 
     async def test_connection(self) -> tuple[bool, str, int | None]:
@@ -168,7 +168,7 @@ class GhostIntegration(BaseIntegration[GhostNewsletter]):
             return True, f"Connected to {title}", elapsed_ms
 
         except Exception as e:
-            logger.error(f"Ghost connection test failed: {e}")
+            logger.error("Ghost connection test failed: %s", e)
             return False, str(e), None
 
     async def fetch_data(self, **kwargs: Any) -> list[GhostNewsletter]:
@@ -181,23 +181,27 @@ class GhostIntegration(BaseIntegration[GhostNewsletter]):
             return []
 
         try:
-            response = await self._request("GET", "/ghost/api/admin/newsletters/")
-            newsletters = response.get("newsletters", [])
+            # Let Ghost filter out archived newsletters server-side
+            response = await self._request(
+                "GET",
+                "/ghost/api/admin/newsletters/",
+                params={"filter": "status:active"},
+            )
 
+            # Trusted API payload: skip pydantic validation
             return [
-                GhostNewsletter(
+                GhostNewsletter.model_construct(
                     id=n["id"],
                     name=n["name"],
                     slug=n["slug"],
                     description=n.get("description"),
                     status=n.get("status", "active"),
                 )
-                for n in newsletters
-                if n.get("status") == "active"
+                for n in response.get("newsletters", ())
             ]
 
         except Exception as e:
-            logger.error(f"Failed to fetch Ghost newsletters: {e}")
+            logger.error("Failed to fetch Ghost newsletters: %s", e)
             return []
 
     async def get_newsletter_slug_by_id(self, newsletter_id: str) -> str | None:
@@ -237,7 +241,8 @@ class GhostIntegration(BaseIntegration[GhostNewsletter]):
     ) -> GhostPost | None:
         """Create a new post in Ghost.
 
-        Ghost's API requires a 2-step process for sending emails:
+        Without email, the post is created directly with its target status in a
+        single POST. Ghost's API requires a 2-step process for sending emails:
         1. Create the post as draft
         2. PUT to publish with newsletter slug in URL to send email
 
@@ -256,14 +261,23 @@ class GhostIntegration(BaseIntegration[GhostNewsletter]):
             # Convert HTML to MobileDoc format (Ghost's internal format)
             mobiledoc = self._html_to_mobiledoc(html)
 
-            # Step 1: Always create as draft first
+            # No email: create directly with the target status (saves the PUT)
+            single_step = not send_email and status in ("draft", "published")
+
+            # Step 1: Create as draft first when an email has to be sent
             post_data: dict[str, Any] = {
                 "title": title,
                 "mobiledoc": mobiledoc,
-                "status": "draft",  # Always create as draft first
+                "status": status if single_step else "draft",
             }
 
-            logger.info(f"Creating Ghost post: title='{title}', target_status={status}, send_email={send_email}, email_only={email_only}")
+            logger.info(
+                "Creating Ghost post: title=%r, target_status=%s, send_email=%s, email_only=%s",
+                title,
+                status,
+                send_email,
+                email_only,
+            )
 
             response = await self._request(
                 "POST",
@@ -280,7 +294,11 @@ class GhostIntegration(BaseIntegration[GhostNewsletter]):
             post_id = post["id"]
             updated_at = post["updated_at"]
 
-            logger.info(f"Ghost post created as draft: id={post_id}")
+            if single_step:
+                logger.info("Ghost post created: id=%s, status=%s", post_id, post["status"])
+                return self._post_to_model(post)
+
+            logger.info("Ghost post created as draft: id=%s", post_id)
 
             # Step 2: If email is requested, publish with newsletter
             if send_email:
@@ -291,20 +309,20 @@ class GhostIntegration(BaseIntegration[GhostNewsletter]):
                     # Get slug from provided ID
                     newsletter_slug = await self.get_newsletter_slug_by_id(newsletter_id)
                     if not newsletter_slug:
-                        logger.warning(f"Newsletter with ID {newsletter_id} not found, trying auto-select")
+                        logger.warning("Newsletter with ID %s not found, trying auto-select", newsletter_id)
 
                 # Auto-select first active newsletter if none specified or not found
                 if not newsletter_slug:
                     newsletters = await self.get_newsletters()
                     if newsletters:
                         newsletter_slug = newsletters[0].slug
-                        logger.info(f"Newsletter auto-selected: {newsletters[0].name} ({newsletter_slug})")
+                        logger.info("Newsletter auto-selected: %s (%s)", newsletters[0].name, newsletter_slug)
                     else:
                         logger.error("No active newsletter found, cannot send email - falling back to publish only")
                         # Fall through to publish without email
 
                 if newsletter_slug:
-                    logger.info(f"Publishing with email via newsletter: {newsletter_slug}")
+                    logger.info("Publishing with email via newsletter: %s", newsletter_slug)
 
                     # Build PUT URL with newsletter slug
                     put_url = f"/ghost/api/admin/posts/{post_id}/?newsletter={newsletter_slug}"
@@ -329,12 +347,12 @@ class GhostIntegration(BaseIntegration[GhostNewsletter]):
                     put_posts = put_response.get("posts", [])
                     if put_posts:
                         if email_only:
-                            logger.info(f"Email sent (email only) via newsletter: {newsletter_slug}")
+                            logger.info("Email sent (email only) via newsletter: %s", newsletter_slug)
                         else:
-                            logger.info(f"Post published AND email sent via newsletter: {newsletter_slug}")
+                            logger.info("Post published AND email sent via newsletter: %s", newsletter_slug)
                         return self._post_to_model(put_posts[0])
 
-            # Step 2b: If just publish (no email) or email failed, update status
+            # Step 2b: Email could not be sent, fall back to a plain publish
             if status == "published":
                 logger.info("Publishing post without email")
 
@@ -359,7 +377,7 @@ class GhostIntegration(BaseIntegration[GhostNewsletter]):
             return self._post_to_model(post)
 
         except Exception as e:
-            logger.error(f"Failed to create Ghost post: {e}")
+            logger.error("Failed to create Ghost post: %s", e)
 
         return None
 
@@ -412,21 +430,10 @@ class GhostIntegration(BaseIntegration[GhostNewsletter]):
 
             posts = response.get("posts", [])
             if posts:
-                p = posts[0]
-                return GhostPost(
-                    id=p["id"],
-                    uuid=p["uuid"],
-                    title=p["title"],
-                    slug=p["slug"],
-                    url=p["url"],
-                    status=p["status"],
-                    created_at=p["created_at"],
-                    updated_at=p["updated_at"],
-                    published_at=p.get("published_at"),
-                )
+                return self._post_to_model(posts[0])
 
         except Exception as e:
-            logger.error(f"Failed to update Ghost post: {e}")
+            logger.error("Failed to update Ghost post: %s", e)
 
         return None
 
@@ -440,7 +447,7 @@ class GhostIntegration(BaseIntegration[GhostNewsletter]):
             return True
 
         except Exception as e:
-            logger.error(f"Failed to delete Ghost post: {e}")
+            logger.error("Failed to delete Ghost post: %s", e)
             return False
 
 
@@ -60,7 +60,7 @@ class KomgaIntegration(BaseIntegration[BookItem]):
             return False, "Invalid response from Komga", elapsed_ms
 
         except Exception as e:
-            logger.error(f"Komga connection test failed: {e}")
+            logger.error("Komga connection test failed: %s", e)
             return False, str(e), None
 
     async def fetch_data(self, days: int = 7, max_items: int = -1, **kwargs: Any) -> list[BookItem]:
@@ -140,6 +140,6 @@ class KomgaIntegration(BaseIntegration[BookItem]):
                     break
 
         except Exception as e:
-            logger.error(f"Failed to fetch Komga data: {e}")
+            logger.error("Failed to fetch Komga data: %s", e)
 
         return items
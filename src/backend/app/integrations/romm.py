@@ -1,22 +1,55 @@
 """ROMM integration for video game library."""
 
+import asyncio
 import base64
 import time
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Any
 
-import httpx
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from app.core.logging import get_logger
 from app.integrations.base import BaseIntegration
 
 logger = get_logger(__name__)
 
+# Platforms rarely change: share them across integration instances per ROMM URL
+PLATFORMS_CACHE_TTL = 300  # seconds
+_platforms_cache: dict[str, tuple[float, list[dict[str, Any]]]] = {}
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso(value: str) -> datetime:
+    """Parse a ROMM ISO-8601 timestamp (Python 3.11+ accepts the "Z" suffix natively).
+
+    Timestamps with an offset are converted to naive local time, like the
+    datetime.fromtimestamp values used for epoch dates here and in Tautulli.
+    """
+    parsed = datetime.fromisoformat(value)
+    return parsed.astimezone().replace(tzinfo=None) if parsed.tzinfo else parsed
+
+
+def _parse_game_date(value: Any, name: Any) -> datetime | None:
+    """Parse a ROMM date field (ISO string or epoch), or None if missing or invalid."""
+    if not value:
+        return None
+    try:
+        # Handle various ISO formats
+        if isinstance(value, str) and "T" in value:
+            return _parse_iso(value)
+        if isinstance(value, (int, float)):
+            return datetime.fromtimestamp(value)
+    except (ValueError, TypeError) as e:
+        logger.debug("ROMM: Could not parse date %r for game %s: %s", value, name, e)
+    return None
+
 
 class GameItem(BaseModel):
     """Game item from ROMM."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: int
     name: str
     slug: str | None = None
@@ -36,6 +69,7 @@ class ROMMIntegration(BaseIntegration[GameItem]):
     """Integration with ROMM for video game library."""
 
     SERVICE_NAME = "ROMM"
+    PAGE_SIZE = 500
 
     def __init__(self, url: str, api_key: str = "", username: str = "", password: str = ""):
         """Initialize ROMM integration with URL and credentials."""
@@ -43,15 +77,8 @@ class ROMMIntegration(BaseIntegration[GameItem]):
         self.username = username or ""
         self.password = password or ""
 
-    @property
-    def is_configured(self) -> bool:
-        """Check if integration has required configuration."""
-        # ROMM can be configured with either username/password or api_key
-        has_basic_auth = bool(self.username and self.password)
-        has_api_key = bool(self.api_key)
-        return bool(self.url) and (has_basic_auth or has_api_key)
-
-    def _get_default_headers(self) -> dict[str, str]:
+        # Credentials never change after init, so build the headers (including
+        # the encoded Authorization value) once; the base client sends them as-is
         headers = {
             "Accept": "application/json",
             "User-Agent": "Ghostarr/1.0",
@@ -62,23 +89,28 @@ class ROMMIntegration(BaseIntegration[GameItem]):
             headers["Authorization"] = f"Basic {credentials}"
         elif self.api_key:
             headers["Authorization"] = f"Bearer {self.api_key}"
-        return headers
-
-    async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client with appropriate auth."""
-        if self._client is None or self._client.is_closed:
-            auth = None
-            # Use httpx's built-in basic auth if credentials are provided
-            if self.username and self.password:
-                auth = httpx.BasicAuth(self.username, self.password)
-
-            self._client = httpx.AsyncClient(
-                base_url=self.url,
-                timeout=httpx.Timeout(self.DEFAULT_TIMEOUT),
-                headers=self._get_default_headers(),
-                auth=auth,
-            )
-        return self._client
+        self._default_headers = headers
+
+    @property
+    def is_configured(self) -> bool:
+        """Check if integration has required configuration."""
+        # ROMM can be configured with either username/password or api_key
+        has_basic_auth = bool(self.username and self.password)
+        has_api_key = bool(self.api_key)
+        return bool(self.url) and (has_basic_auth or has_api_key)
+
+    def _get_default_headers(self) -> dict[str, str]:
+        return self._default_headers
+
+    async def _get_platforms(self) -> list[dict[str, Any]]:
+        """Get ROMM platforms, reusing a recent result for the same server."""
+        cached = _platforms_cache.get(self.url)
+        if cached and time.monotonic() - cached[0] < PLATFORMS_CACHE_TTL:
+            return cached[1]
+
+        platforms = await self._request("GET", "/api/platforms")
+        _platforms_cache[self.url] = (time.monotonic(), platforms)
+        return platforms
 
     async def test_connection(self) -> tuple[bool, str, int | None]:
         """Test connection to ROMM."""
@@ -106,119 +138,145 @@ class ROMMIntegration(BaseIntegration[GameItem]):
             return []
 
         items: list[GameItem] = []
-        since_date = datetime.now() - timedelta(days=days)
+        append_item = items.append
+        since_ts = (datetime.now() - timedelta(days=days)).timestamp()
 
         try:
-            # Get all platforms first to build a mapping
-            platforms = await self._request("GET", "/api/platforms")
-            logger.info(f"ROMM: Found {len(platforms)} platforms")
-
-            platform_map = {p.get("id"): p for p in platforms}
-
-            # Fetch all ROMs using the /api/roms endpoint with sorting
-            # ROMM API uses /api/roms with optional platform_id filter
+            # Fetch ROMs page by page, newest first, so only the recent prefix
+            # of the library is transferred and parsed
+            page_size = self.PAGE_SIZE if max_items == -1 else min(max_items, self.PAGE_SIZE)
             params: dict[str, Any] = {
                 "order_by": "created_at",
                 "order_dir": "desc",
+                "limit": page_size,
+                "offset": 0,
             }
-            if max_items != -1:
-                params["limit"] = max_items
-
-            roms_response = await self._request("GET", "/api/roms", params=params)
-
-            # Handle both list response and paginated response
-            if isinstance(roms_response, dict):
-                games = roms_response.get("items", roms_response.get("roms", []))
-            else:
-                games = roms_response
-
-            logger.info(f"ROMM: Fetched {len(games)} ROMs")
-
-            for game in games:
-                # Get platform info
-                platform_id = game.get("platform_id")
-                platform_info = platform_map.get(platform_id, {})
-                platform_name = platform_info.get("name", "Unknown")
-                platform_slug = platform_info.get("slug", "")
-
-                # Parse date - try multiple fields
-                date_str = game.get("created_at") or game.get("updated_at")
-                game_date = None
-
-                if date_str:
-                    try:
-                        # Handle various ISO formats
-                        if isinstance(date_str, str) and "T" in date_str:
-                            game_date = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-                        elif isinstance(date_str, (int, float)):
-                            game_date = datetime.fromtimestamp(date_str)
-                    except (ValueError, TypeError) as e:
-                        logger.debug(f"ROMM: Could not parse date '{date_str}' for game {game.get('name')}: {e}")
-
-                # If we have a date and it's too old, skip
-                if game_date:
-                    game_date_naive = game_date.replace(tzinfo=None) if game_date.tzinfo else game_date
-                    if game_date_naive < since_date:
+            offset = 0
+            reached_cutoff = False
+
+            # Platforms (for the name/slug mapping) and the first ROM page are
+            # independent, so request them concurrently
+            platforms, roms_response = await asyncio.gather(
+                self._get_platforms(),
+                self._request("GET", "/api/roms", params=params),
+            )
+            logger.info(f"ROMM: Found {len(platforms)} platforms")
+
+            # Resolve each platform's (name, slug) once instead of per ROM
+            platform_map = {
+                p.get("id"): (p.get("name", "Unknown"), p.get("slug", "")) for p in platforms
+            }
+            unknown_platform = ("Unknown", "")
+
+            base_url = self.url
+            cover_prefix = f"{base_url}/api/roms/"
+
+            while True:
+                # Handle both list response and paginated response
+                if isinstance(roms_response, dict):
+                    games = roms_response.get("items", roms_response.get("roms", []))
+                    total = roms_response.get("total")
+                else:
+                    # Unpaginated API: the whole catalog came back at once
+                    games = roms_response
+                    total = len(games)
+
+                logger.info("ROMM: Fetched %d ROMs (offset %d)", len(games), offset)
+
+                for game in games:
+                    # Get platform info
+                    platform_name, platform_slug = platform_map.get(
+                        game.get("platform_id"), unknown_platform
+                    )
+
+                    # ROMs are sorted by created_at desc: once a ROM's created_at is
+                    # older than the window, every following one is too
+                    created_at = _parse_game_date(game.get("created_at"), game.get("name"))
+                    if created_at and created_at.timestamp() < since_ts:
+                        reached_cutoff = True
+                        break
+
+                    # Without created_at, fall back to updated_at for this ROM only
+                    # (undated ROMs are kept)
+                    game_date = created_at or _parse_game_date(
+                        game.get("updated_at"), game.get("name")
+                    )
+                    if game_date and game_date.timestamp() < since_ts:
                         continue
 
-                # Build cover URL - ROMM API uses path_cover_s/m/l or url_cover
-                cover_path = game.get("path_cover_l") or game.get("path_cover_m") or game.get("path_cover_s") or game.get("url_cover")
-                cover_url = None
-                if cover_path:
-                    if cover_path.startswith("http"):
-                        cover_url = cover_path
-                    else:
-                        # Build full URL for cover
-                        cover_url = f"{self.url}/api/roms/{game.get('id')}/cover"
-
-                # Build screenshot URL
-                screenshots = game.get("url_screenshots") or game.get("path_screenshots") or []
-                background_url = None
-                if screenshots and len(screenshots) > 0:
-                    bg = screenshots[0]
-                    if bg and bg.startswith("http"):
-                        background_url = bg
-                    elif bg:
-                        background_url = f"{self.url}{bg}"
-
-                # Extract release year from IGDB metadata
-                # ROMM may expose this at top level or nested in igdb_metadata
-                release_year = None
-                first_release_date = game.get("first_release_date") or game.get("release_date")
-                if not first_release_date:
-                    igdb_meta = game.get("igdb_metadata") or game.get("moby_metadata") or {}
-                    if isinstance(igdb_meta, dict):
-                        first_release_date = igdb_meta.get("first_release_date")
-                if first_release_date:
-                    try:
-                        if isinstance(first_release_date, (int, float)):
-                            release_year = datetime.fromtimestamp(first_release_date).year
-                        elif isinstance(first_release_date, str):
-                            release_year = int(first_release_date[:4])
-                    except (ValueError, TypeError):
-                        pass
-
-                game_item = GameItem(
-                    id=game.get("id", 0),
-                    name=game.get("name") or game.get("file_name") or "Unknown",
-                    slug=game.get("slug", ""),
-                    platform=platform_name,
-                    platform_slug=platform_slug,
-                    file_name=game.get("file_name", ""),
-                    cover_url=cover_url,
-                    background_url=background_url,
-                    summary=game.get("summary"),
-                    igdb_id=game.get("igdb_id"),
-                    release_year=release_year,
-                    created_at=game_date,
-                )
-                items.append(game_item)
-                logger.debug(f"ROMM: Added game {game_item.name} (platform: {platform_name}, date: {game_date})")
+                    # Build cover URL - ROMM API uses path_cover_s/m/l or url_cover
+                    cover_path = game.get("path_cover_l") or game.get("path_cover_m") or game.get("path_cover_s") or game.get("url_cover")
+                    cover_url = None
+                    if cover_path:
+                        if cover_path.startswith("http"):
+                            cover_url = cover_path
+                        else:
+                            # Build full URL for cover
+                            cover_url = f"{cover_prefix}{game.get('id')}/cover"
+
+                    # Build screenshot URL
+                    screenshots = game.get("url_screenshots") or game.get("path_screenshots") or []
+                    background_url = None
+                    if screenshots and len(screenshots) > 0:
+                        bg = screenshots[0]
+                        if bg and bg.startswith("http"):
+                            background_url = bg
+                        elif bg:
+                            background_url = base_url + bg
+
+                    # Extract release year from IGDB metadata
+                    # ROMM may expose this at top level or nested in igdb_metadata
+                    release_year = None
+                    first_release_date = game.get("first_release_date") or game.get("release_date")
+                    if not first_release_date:
+                        igdb_meta = game.get("igdb_metadata") or game.get("moby_metadata") or {}
+                        if isinstance(igdb_meta, dict):
+                            first_release_date = igdb_meta.get("first_release_date")
+                    if first_release_date:
+                        try:
+                            if isinstance(first_release_date, (int, float)):
+                                release_year = datetime.fromtimestamp(first_release_date).year
+                            elif isinstance(first_release_date, str):
+                                release_year = int(first_release_date[:4])
+                        except (ValueError, TypeError):
+                            pass
+
+                    # Fields are normalized above, so skip pydantic validation
+                    game_item = GameItem.model_construct(
+                        id=game.get("id") or 0,
+                        name=game.get("name") or game.get("file_name") or "Unknown",
+                        slug=game.get("slug", ""),
+                        platform=platform_name,
+                        platform_slug=platform_slug,
+                        file_name=game.get("file_name") or "",
+                        cover_url=cover_url,
+                        background_url=background_url,
+                        summary=game.get("summary"),
+                        igdb_id=game.get("igdb_id"),
+                        release_year=release_year,
+                        created_at=game_date,
+                    )
+                    append_item(game_item)
+                    if max_items != -1 and len(items) >= max_items:
+                        break
 
                 if max_items != -1 and len(items) >= max_items:
                     logger.info(f"ROMM: Reached max_items limit ({max_items})")
                     return items
 
+                offset += len(games)
+                if reached_cutoff or not games:
+                    break
+                if total is not None:
+                    if offset >= total:
+                        break
+                elif len(games) < page_size:
+                    # Without a total, a short page means the catalog is exhausted
+                    break
+
+                params["offset"] = offset
+                roms_response = await self._request("GET", "/api/roms", params=params)
+
         except Exception as e:
             logger.error(f"Failed to fetch ROMM data: {e}", exc_info=True)
 
@@ -1,20 +1,93 @@
 """Tautulli integration for media server statistics."""
 
+import asyncio
 import time
+from collections import Counter
 from datetime import datetime, timedelta
 from typing import Any
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, computed_field
 
+from app.core.exceptions import IntegrationError
 from app.core.logging import get_logger
 from app.integrations.base import BaseIntegration
 
 logger = get_logger(__name__)
 
+# Tautulli statistics only move as new plays are recorded, so successful
+# responses are reused for a few minutes (e.g. a preview followed by the
+# actual generation) instead of querying Tautulli again. get_history is left
+# out: its pages are large and each one is only read once.
+RESPONSE_CACHE_TTL = 300  # seconds
+CACHEABLE_COMMANDS = frozenset(
+    {
+        "get_home_stats",
+        "get_libraries",
+        "get_plays_by_date",
+        "get_plays_by_hourofday",
+        "get_plays_by_dayofweek",
+    }
+)
+_response_cache: dict[tuple[Any, ...], tuple[float, dict[str, Any]]] = {}
+# Fully computed statistics, keyed by (url, days, include_comparison)
+_statistics_cache: dict[tuple[str, int, bool], tuple[float, "TautulliStatistics"]] = {}
+
+
+def _safe_int(value: Any) -> int:
+    """Safely convert a value to int, handling strings and None."""
+    # Fast path: Tautulli mostly returns real ints
+    if type(value) is int:
+        return value
+    # Empty chart cells come back as None or "": skip the exception path
+    if value is None or value == "":
+        return 0
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return 0
+
+
+def _safe_optional_int(value: Any) -> int | None:
+    """Convert an optional value to int, returning None when missing or invalid."""
+    if type(value) is int:
+        return value
+    if value is None or value == "":
+        return None
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return None
+
+
+# Library name keywords; "movies"/"films"/"series" are covered by their prefixes
+MOVIE_LIBRARY_KEYWORDS = ("movie", "film")
+TV_LIBRARY_KEYWORDS = ("tv", "show", "serie", "séries")
+
+
+def _library_kind(name: str) -> str | None:
+    """Classify a Tautulli library name as "movies", "series" or None if unknown."""
+    lowered = name.lower()
+    if any(keyword in lowered for keyword in MOVIE_LIBRARY_KEYWORDS):
+        return "movies"
+    if any(keyword in lowered for keyword in TV_LIBRARY_KEYWORDS):
+        return "series"
+    return None
+
+
+def _sum_series(series_data: list[dict[str, Any]], size: int) -> list[int]:
+    """Sum Tautulli chart series point-wise over the first size categories."""
+    totals = [0] * size
+    for serie in series_data:
+        for idx, value in enumerate(serie.get("data", [])[:size]):
+            totals[idx] += _safe_int(value)
+    return totals
+
 
 class MediaItem(BaseModel):
     """Media item from Tautulli."""
 
+    model_config = ConfigDict(frozen=True)
+
     title: str
     year: int | None = None
     media_type: str  # "movie" or "episode"
@@ -82,7 +155,6 @@ class TautulliStatistics(BaseModel):
     # General statistics
     total_plays: int = 0
     total_duration: int = 0  # seconds
-    total_watch_time: int = 0  # seconds (same as total_duration, for template compatibility)
     movies_plays: int = 0
     series_plays: int = 0
     unique_users: int = 0
@@ -121,11 +193,21 @@ class TautulliStatistics(BaseModel):
     top_movies: list[dict[str, Any]] = []
     top_shows: list[dict[str, Any]] = []
 
+    @computed_field
+    @property
+    def total_watch_time(self) -> int:
+        """Total watch time in seconds (same as total_duration, for template compatibility)."""
+        return self.total_duration
+
 
 class TautulliIntegration(BaseIntegration[MediaItem]):
     """Integration with Tautulli for Plex/Jellyfin statistics."""
 
     SERVICE_NAME = "Tautulli"
+    HISTORY_PAGE_LENGTH = 1000
+    HISTORY_MAX_RECORDS = 5000
+    # fetch_statistics fans out several requests at once
+    MAX_CONCURRENT_REQUESTS = 4
 
     def _get_default_headers(self) -> dict[str, str]:
         return {
@@ -133,6 +215,34 @@ class TautulliIntegration(BaseIntegration[MediaItem]):
             "User-Agent": "Ghostarr/1.0",
         }
 
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """Override to serve statistics commands from a short-lived cache."""
+        if method != "GET" or not params or params.get("cmd") not in CACHEABLE_COMMANDS:
+            return await super()._request(method, path, params, json, **kwargs)
+
+        key = (self.url, path, tuple(sorted(params.items())))
+        now = time.monotonic()
+        cached = _response_cache.get(key)
+        if cached and now - cached[0] < RESPONSE_CACHE_TTL:
+            return cached[1]
+
+        response = await super()._request(method, path, params, json, **kwargs)
+
+        if response.get("response", {}).get("result") == "success":
+            # Drop expired entries so the cache stays bounded
+            for stale_key in [k for k, (ts, _) in _response_cache.items() if now - ts >= RESPONSE_CACHE_TTL]:
+                del _response_cache[stale_key]
+            _response_cache[key] = (now, response)
+
+        return response
+
     async def test_connection(self) -> tuple[bool, str, int | None]:
         """Test connection to Tautulli."""
         if not self.is_configured:
@@ -154,7 +264,7 @@ class TautulliIntegration(BaseIntegration[MediaItem]):
             return False, "Invalid response from Tautulli", elapsed_ms
 
         except Exception as e:
-            logger.error(f"Tautulli connection test failed: {e}")
+            logger.error("Tautulli connection test failed: %s", e)
             return False, str(e), None
 
     async def fetch_data(self, days: int = 7, max_items: int = -1, **kwargs: Any) -> list[MediaItem]:
@@ -163,8 +273,7 @@ class TautulliIntegration(BaseIntegration[MediaItem]):
             return []
 
         items: list[MediaItem] = []
-        since_date = datetime.now() - timedelta(days=days)
-        since_timestamp = int(since_date.timestamp())
+        since_timestamp = int(time.time()) - days * 86400
 
         try:
             # Fetch recently added
@@ -182,36 +291,22 @@ class TautulliIntegration(BaseIntegration[MediaItem]):
             recently_added = data.get("recently_added", [])
 
             for item in recently_added:
-                added_at_raw = item.get("added_at", 0)
-                # Convert to int if it's a string
-                try:
-                    added_at = int(added_at_raw) if added_at_raw else 0
-                except (ValueError, TypeError):
-                    added_at = 0
-
+                # Tautulli sends added_at as a string epoch
+                added_at = _safe_int(item.get("added_at"))
                 if added_at < since_timestamp:
                     continue
 
-                # Parse optional integer fields safely
-                def safe_int(val: Any) -> int | None:
-                    if val is None or val == "":
-                        return None
-                    try:
-                        return int(val)
-                    except (ValueError, TypeError):
-                        return None
-
-                media_item = MediaItem(
-                    title=item.get("title", "Unknown"),
-                    year=safe_int(item.get("year")),
+                media_item = MediaItem.model_construct(
+                    title=item.get("title") or "Unknown",
+                    year=_safe_optional_int(item.get("year")),
                     media_type="episode" if item.get("media_type") == "episode" else "movie",
                     rating_key=str(item.get("rating_key", "")),
                     thumb=item.get("thumb"),
                     art=item.get("art"),
                     added_at=datetime.fromtimestamp(added_at) if added_at else None,
                     grandparent_title=item.get("grandparent_title"),
-                    parent_media_index=safe_int(item.get("parent_media_index")),
-                    media_index=safe_int(item.get("media_index")),
+                    parent_media_index=_safe_optional_int(item.get("parent_media_index")),
+                    media_index=_safe_optional_int(item.get("media_index")),
                 )
                 items.append(media_item)
 
@@ -219,7 +314,7 @@ class TautulliIntegration(BaseIntegration[MediaItem]):
                     break
 
         except Exception as e:
-            logger.error(f"Failed to fetch Tautulli data: {e}")
+            logger.error("Failed to fetch Tautulli data: %s", e)
 
         return items
 
@@ -233,121 +328,77 @@ class TautulliIntegration(BaseIntegration[MediaItem]):
         if not self.is_configured:
             return TautulliStatistics()
 
+        # Reuse a recent result for the same request; callers get their own
+        # copy so they can't alter the cached statistics
+        cache_key = (self.url, days, include_comparison)
+        now = time.monotonic()
+        cached = _statistics_cache.get(cache_key)
+        if cached and now - cached[0] < RESPONSE_CACHE_TTL:
+            return cached[1].model_copy(deep=True)
+
         stats = TautulliStatistics()
-        previous_stats: TautulliStatistics | None = None
 
         try:
-            # Get home stats (top movies, shows, users)
-            await self._fetch_home_stats(stats, days)
-
-            # Get library media info
-            await self._fetch_library_stats(stats)
-
-            # Get plays by date for totals
-            await self._fetch_plays_by_date(stats, days)
-
-            # Get plays by hour of day
-            await self._fetch_plays_by_hour(stats, days)
+            # The endpoints are independent and fill disjoint fields of stats
+            # (the previous period only feeds the comparison computed below),
+            # so query them concurrently. A failing endpoint is logged
+            # without discarding the others.
+            fetchers = {
+                "home stats": self._fetch_home_stats(stats, days),
+                "library stats": self._fetch_library_stats(stats),
+                "plays by date": self._fetch_plays_by_date(stats, days),
+                "plays by hour": self._fetch_plays_by_hour(stats, days),
+                "plays by day of week": self._fetch_plays_by_dayofweek(stats, days),
+            }
+            if include_comparison:
+                fetchers["previous period"] = self._fetch_previous_period(days)
 
-            # Get plays by day of week
-            await self._fetch_plays_by_dayofweek(stats, days)
+            results = dict(
+                zip(
+                    fetchers,
+                    await asyncio.gather(*fetchers.values(), return_exceptions=True),
+                    strict=True,
+                )
+            )
+            failed = False
+            for name, result in results.items():
+                if isinstance(result, Exception):
+                    failed = True
+                    logger.warning("Failed to fetch Tautulli %s: %s", name, result)
 
             # Calculate content distribution
             total = stats.movies_plays + stats.series_plays
             if total > 0:
                 stats.content_distribution = {
-                    "movies": int((stats.movies_plays / total) * 100),
-                    "series": int((stats.series_plays / total) * 100),
+                    "movies": stats.movies_plays * 100 // total,
+                    "series": stats.series_plays * 100 // total,
                 }
 
-            # Fetch previous period stats for comparison
-            if include_comparison:
-                previous_stats = await self._fetch_previous_period_stats(days)
-                previous_rankings = await self._fetch_previous_rankings(days)
+            # Compare with the previous period
+            previous = results.get("previous period")
+            if previous is not None and not isinstance(previous, Exception):
+                previous_stats, previous_rankings = previous
                 self._calculate_comparison(stats, previous_stats, previous_rankings)
 
-        except Exception as e:
-            logger.error(f"Failed to fetch Tautulli statistics: {e}")
-
-        return stats
-
-    async def _fetch_previous_period_stats(self, days: int) -> TautulliStatistics:
-        """Fetch statistics from the previous period for comparison."""
-        previous_stats = TautulliStatistics()
-
-        try:
-            # For previous period, we need to offset the time_range
-            # Tautulli doesn't have a direct way to specify a date range,
-            # so we fetch 2x the period and calculate the difference
-
-            # Fetch home stats for double the period
-            response = await self._request(
-                "GET",
-                "/api/v2",
-                params={
-                    "apikey": self.api_key,
-                    "cmd": "get_home_stats",
-                    "time_range": days * 2,
-                    "stats_type": "duration",
-                    "stats_count": 10,
-                },
-            )
-
-            data = response.get("response", {}).get("data", [])
-
-            for stat in data:
-                stat_id = stat.get("stat_id", "")
-                rows = stat.get("rows", [])
-
-                if stat_id == "top_users":
-                    # Total duration for the full 2x period
-                    total_2x = sum(self._safe_int(row.get("total_duration", 0)) for row in rows)
-                    previous_stats.total_duration = total_2x
-                    previous_stats.total_watch_time = total_2x
-                    previous_stats.unique_users = len(rows)
-
-            # Fetch plays by date for the double period
-            response = await self._request(
-                "GET",
-                "/api/v2",
-                params={
-                    "apikey": self.api_key,
-                    "cmd": "get_plays_by_date",
-                    "time_range": days * 2,
-                },
-            )
-
-            plays_data = response.get("response", {}).get("data", {})
-            series_data = plays_data.get("series", [])
-
-            # Sum plays for the full 2x period
-            total_plays_2x = 0
-            for serie in series_data:
-                data_points = serie.get("data", [])
-                total_plays_2x += sum(self._safe_int(dp) for dp in data_points)
-
-            previous_stats.total_plays = total_plays_2x
+            # Only cache complete results so a transient failure is retried
+            if not failed:
+                _statistics_cache[cache_key] = (now, stats.model_copy(deep=True))
 
         except Exception as e:
-            logger.warning(f"Failed to fetch previous period stats: {e}")
+            logger.error("Failed to fetch Tautulli statistics: %s", e)
 
-        return previous_stats
+        return stats
 
     def _calculate_comparison(
         self,
         current: TautulliStatistics,
-        previous_2x: TautulliStatistics,
+        previous: TautulliStatistics,
         previous_rankings: dict[str, dict[str, int]],
     ) -> None:
-        """Calculate growth percentages comparing current period to previous period.
-
-        Since we fetched 2x the period, we need to subtract current from 2x to get previous.
-        """
-        # Previous period values = 2x period - current period
-        previous_plays = max(0, previous_2x.total_plays - current.total_plays)
-        previous_watch_time = max(0, previous_2x.total_watch_time - current.total_watch_time)
-        # For users, we can't easily subtract, so estimate based on proportion
-        previous_users = max(1, previous_2x.unique_users)  # Approximate
+        """Calculate growth percentages comparing current period to previous period."""
+        previous_plays = previous.total_plays
+        previous_watch_time = previous.total_watch_time
+        previous_users = previous.unique_users
 
         # Store previous values
         current.previous_total_plays = previous_plays
@@ -378,108 +429,154 @@ class TautulliIntegration(BaseIntegration[MediaItem]):
         self._update_evolution_types(current, previous_rankings)
 
         logger.info(
-            f"Comparison calculated - Current: plays={current.total_plays}, watch_time={current.total_watch_time}, users={current.unique_users}"
-        )
-        logger.info(
-            f"Comparison calculated - Previous: plays={previous_plays}, watch_time={previous_watch_time}, users={previous_users}"
-        )
-        logger.info(
-            f"Comparison calculated - Growth: plays={current.plays_growth_percentage}%, "
-            f"time={current.time_growth_percentage}%, users={current.users_growth_percentage}%"
+            "Comparison calculated - plays=%s (previous %s, %s%%), "
+            "watch_time=%s (previous %s, %s%%), users=%s (previous %s, %s%%)",
+            current.total_plays, previous_plays, current.plays_growth_percentage,
+            current.total_watch_time, previous_watch_time, current.time_growth_percentage,
+            current.unique_users, previous_users, current.users_growth_percentage,
         )
 
-    async def _fetch_previous_rankings(self, days: int) -> dict[str, dict[str, int]]:
-        """Fetch rankings from the previous period to calculate evolution.
+    async def _fetch_previous_period(
+        self, days: int
+    ) -> tuple[TautulliStatistics, dict[str, dict[str, int]]]:
+        """Fetch totals and rankings from the previous period for comparison.
+
+        Plays come from get_history's recordsFiltered, and rankings from at
+        most HISTORY_MAX_RECORDS history rows. Users and watch time come from
+        get_home_stats' top 10 users, the same query used for the current period.
 
-        Uses get_history API with after/before date filters to get playback data
-        for the previous period, then calculates rankings based on play counts.
+        Raises IntegrationError when either request fails, so the comparison
+        is skipped rather than computed against an empty period.
 
-        Returns a dict with 'movies', 'shows', 'users' keys, each containing
+        Returns a tuple of (previous_stats, previous_rankings), where
+        previous_rankings has 'movies', 'shows', 'users' keys, each containing
         a dict mapping title/username to their previous position (1-indexed).
         """
+        previous_stats = TautulliStatistics()
         previous_rankings: dict[str, dict[str, int]] = {
             "movies": {},
             "shows": {},
             "users": {},
         }
 
-        try:
-            # Previous period: from (2*days ago) to (days ago)
-            end_date = datetime.now() - timedelta(days=days)
-            start_date = end_date - timedelta(days=days)
+        # Previous period: the `days` days before the current one. Tautulli's
+        # after/before bounds are inclusive and the current period reaches back
+        # to (days ago), so the previous one ends the day before that
+        end_date = datetime.now() - timedelta(days=days + 1)
+        start_date = end_date - timedelta(days=days - 1)
+        after = start_date.strftime("%Y-%m-%d")
+        before = end_date.strftime("%Y-%m-%d")
 
-            logger.info(
-                f"Fetching previous rankings for period {start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')} using get_history"
-            )
+        logger.info(
+            "Fetching previous rankings for period %s to %s using get_history",
+            after, before,
+        )
 
-            # Fetch history for the previous period
-            response = await self._request(
+        # Most periods fit in the first history page; only request the rest
+        # (up to HISTORY_MAX_RECORDS) when Tautulli reports more
+        params: dict[str, Any] = {
+            "apikey": self.api_key,
+            "cmd": "get_history",
+            "after": after,
+            "before": before,
+            "include_activity": 0,
+            "start": 0,
+            "length": self.HISTORY_PAGE_LENGTH,
+        }
+        response, users_response = await asyncio.gather(
+            self._request("GET", "/api/v2", params=params),
+            self._request(
                 "GET",
                 "/api/v2",
                 params={
                     "apikey": self.api_key,
-                    "cmd": "get_history",
-                    "after": start_date.strftime("%Y-%m-%d"),
-                    "before": end_date.strftime("%Y-%m-%d"),
-                    "length": 5000,  # Get enough records
+                    "cmd": "get_home_stats",
+                    "stat_id": "top_users",
+                    "stats_type": "duration",
+                    "stats_count": 10,
+                    "after": after,
+                    "before": before,
                 },
+            ),
+        )
+
+        result = response.get("response", {}).get("result")
+        logger.info("Previous rankings get_history result: %s", result)
+        users_result = users_response.get("response", {}).get("result")
+
+        if result != "success" or users_result != "success":
+            raise IntegrationError(
+                service=self.SERVICE_NAME,
+                message=(
+                    f"previous period returned {result!r} (get_history), "
+                    f"{users_result!r} (get_home_stats)"
+                ),
             )
 
-            result = response.get("response", {}).get("result")
-            logger.info(f"Previous rankings get_history result: {result}")
+        history_page = response.get("response", {}).get("data", {})
+        history_data = history_page.get("data", [])
+        records_filtered = _safe_int(history_page.get("recordsFiltered"))
+        wanted = min(records_filtered, self.HISTORY_MAX_RECORDS)
+
+        if len(history_data) < wanted:
+            params["start"] = len(history_data)
+            params["length"] = wanted - len(history_data)
+            response = await self._request("GET", "/api/v2", params=params)
+            history_data = history_data + response.get("response", {}).get("data", {}).get("data", [])
 
-            if result != "success":
-                logger.warning("Failed to fetch history for previous period")
-                return previous_rankings
+        logger.info("Previous period history records: %s", len(history_data))
 
-            history_data = response.get("response", {}).get("data", {}).get("data", [])
-            logger.info(f"Previous period history records: {len(history_data)}")
+        # Aggregate play counts by title/user
+        movie_plays: Counter[str] = Counter()
+        show_plays: Counter[str] = Counter()
+        user_plays: Counter[str] = Counter()
 
-            # Aggregate play counts by title/user
-            movie_plays: dict[str, int] = {}
-            show_plays: dict[str, int] = {}
-            user_plays: dict[str, int] = {}
+        for record in history_data:
+            get = record.get
 
-            for record in history_data:
-                media_type = record.get("media_type", "")
-                title = record.get("full_title", "") or record.get("title", "")
-                user = record.get("friendly_name", "") or record.get("user", "")
+            # Count user plays regardless of media type
+            user = get("friendly_name") or get("user")
+            if user:
+                user_plays[user] += 1
 
+            # Only look up titles for media types that are ranked
+            media_type = get("media_type")
+            if media_type == "episode":
                 # For shows, use grandparent_title (series name)
-                if media_type == "episode":
-                    show_title = record.get("grandparent_title", "") or title
-                    if show_title:
-                        show_plays[show_title] = show_plays.get(show_title, 0) + 1
-                elif media_type == "movie":
-                    if title:
-                        movie_plays[title] = movie_plays.get(title, 0) + 1
-
-                # Count user plays regardless of media type
-                if user:
-                    user_plays[user] = user_plays.get(user, 0) + 1
-
-            # Sort by play count and assign rankings
-            sorted_movies = sorted(movie_plays.items(), key=lambda x: x[1], reverse=True)
-            for position, (title, _) in enumerate(sorted_movies[:10], 1):
-                previous_rankings["movies"][title] = position
-
-            sorted_shows = sorted(show_plays.items(), key=lambda x: x[1], reverse=True)
-            for position, (title, _) in enumerate(sorted_shows[:10], 1):
-                previous_rankings["shows"][title] = position
-
-            sorted_users = sorted(user_plays.items(), key=lambda x: x[1], reverse=True)
-            for position, (username, _) in enumerate(sorted_users[:10], 1):
-                previous_rankings["users"][username] = position
+                title = get("grandparent_title") or get("full_title") or get("title")
+                if title:
+                    show_plays[title] += 1
+            elif media_type == "movie":
+                title = get("full_title") or get("title")
+                if title:
+                    movie_plays[title] += 1
+
+        # recordsFiltered counts every play, even beyond the fetched rows
+        previous_stats.total_plays = records_filtered
+        for stat in users_response.get("response", {}).get("data", []):
+            if stat.get("stat_id") == "top_users":
+                rows = stat.get("rows", [])
+                previous_stats.unique_users = len(rows)
+                previous_stats.total_duration = sum(
+                    _safe_int(row.get("total_duration", 0)) for row in rows
+                )
 
-            logger.info(
-                f"Previous rankings calculated from history - movies: {previous_rankings['movies']}, "
-                f"shows: {previous_rankings['shows']}, users: {previous_rankings['users']}"
-            )
+        # Rank the top 10 by play count (most_common uses a heap, not a full sort)
+        for position, (title, _) in enumerate(movie_plays.most_common(10), 1):
+            previous_rankings["movies"][title] = position
 
-        except Exception as e:
-            logger.warning(f"Failed to fetch previous rankings: {e}")
+        for position, (title, _) in enumerate(show_plays.most_common(10), 1):
+            previous_rankings["shows"][title] = position
 
-        return previous_rankings
+        for position, (username, _) in enumerate(user_plays.most_common(10), 1):
+            previous_rankings["users"][username] = position
+
+        logger.info(
+            "Previous rankings calculated from history - movies: %s, shows: %s, users: %s",
+            previous_rankings["movies"], previous_rankings["shows"], previous_rankings["users"],
+        )
+
+        return previous_stats, previous_rankings
 
     def _calculate_item_evolution(
         self, current_position: int, previous_position: int | None
@@ -516,17 +613,21 @@ class TautulliIntegration(BaseIntegration[MediaItem]):
         Compares current rankings with previous period rankings to determine
         if each item moved up, down, is new, or stayed stable.
         """
-        logger.info(f"Updating evolution types with previous rankings: {previous_rankings}")
+        logger.info("Updating evolution types with previous rankings: %s", previous_rankings)
+
+        prev_movies = previous_rankings.get("movies", {})
+        prev_shows = previous_rankings.get("shows", {})
+        prev_users = previous_rankings.get("users", {})
 
         # For movies - calculate individual evolution based on ranking change
         for position, movie in enumerate(stats.top_movies_played, 1):
-            previous_pos = previous_rankings.get("movies", {}).get(movie.title)
+            previous_pos = prev_movies.get(movie.title)
             evolution_type, evolution_value = self._calculate_item_evolution(
                 position, previous_pos
             )
             logger.info(
-                f"Movie '{movie.title}': current_pos={position}, previous_pos={previous_pos} "
-                f"-> {evolution_type} ({evolution_value})"
+                "Movie %r: current_pos=%s, previous_pos=%s -> %s (%s)",
+                movie.title, position, previous_pos, evolution_type, evolution_value,
             )
             movie.evolution_type = evolution_type
             movie.evolution_value = evolution_value
@@ -534,13 +635,13 @@ class TautulliIntegration(BaseIntegration[MediaItem]):
 
         # For shows - calculate individual evolution based on ranking change
         for position, show in enumerate(stats.top_shows_played, 1):
-            previous_pos = previous_rankings.get("shows", {}).get(show.title)
+            previous_pos = prev_shows.get(show.title)
             evolution_type, evolution_value = self._calculate_item_evolution(
                 position, previous_pos
             )
             logger.info(
-                f"Show '{show.title}': current_pos={position}, previous_pos={previous_pos} "
-                f"-> {evolution_type} ({evolution_value})"
+                "Show %r: current_pos=%s, previous_pos=%s -> %s (%s)",
+                show.title, position, previous_pos, evolution_type, evolution_value,
             )
             show.evolution_type = evolution_type
             show.evolution_value = evolution_value
@@ -550,13 +651,13 @@ class TautulliIntegration(BaseIntegration[MediaItem]):
         for position, user in enumerate(stats.top_users_by_time, 1):
             # Try friendly_name first, then username
             username = user.friendly_name or user.username
-            previous_pos = previous_rankings.get("users", {}).get(username)
+            previous_pos = prev_users.get(username)
             evolution_type, evolution_value = self._calculate_item_evolution(
                 position, previous_pos
             )
             logger.info(
-                f"User '{username}': current_pos={position}, previous_pos={previous_pos} "
-                f"-> {evolution_type} ({evolution_value})"
+                "User %r: current_pos=%s, previous_pos=%s -> %s (%s)",
+                username, position, previous_pos, evolution_type, evolution_value,
             )
             user.evolution_type = evolution_type
             user.evolution_value = evolution_value
@@ -581,13 +682,14 @@ class TautulliIntegration(BaseIntegration[MediaItem]):
             stat_id = stat.get("stat_id", "")
             rows = stat.get("rows", [])
 
+            # Rows are normalized with _safe_int/str() below, so skip validation
             if stat_id == "top_movies":
                 stats.top_movies = rows[:5]
                 stats.top_movies_played = [
-                    MovieStats(
-                        title=row.get("title", ""),
-                        plays=self._safe_int(row.get("total_plays", 0)),
-                        total_duration=self._safe_int(row.get("total_duration", 0)),
+                    MovieStats.model_construct(
+                        title=row.get("title") or "",
+                        plays=_safe_int(row.get("total_plays", 0)),
+                        total_duration=_safe_int(row.get("total_duration", 0)),
                         thumb=row.get("thumb"),
                         year=str(row.get("year", "")),
                         rating=str(row.get("rating", "")),
@@ -598,10 +700,10 @@ class TautulliIntegration(BaseIntegration[MediaItem]):
             elif stat_id == "top_tv":
                 stats.top_shows = rows[:5]
                 stats.top_shows_played = [
-                    ShowStats(
-                        title=row.get("title", ""),
-                        plays=self._safe_int(row.get("total_plays", 0)),
-                        total_duration=self._safe_int(row.get("total_duration", 0)),
+                    ShowStats.model_construct(
+                        title=row.get("title") or "",
+                        plays=_safe_int(row.get("total_plays", 0)),
+                        total_duration=_safe_int(row.get("total_duration", 0)),
                         thumb=row.get("thumb"),
                         year=str(row.get("year", "")),
                         rating=str(row.get("rating", "")),
@@ -612,19 +714,18 @@ class TautulliIntegration(BaseIntegration[MediaItem]):
             elif stat_id == "top_users":
                 stats.unique_users = len(rows)
                 stats.top_users_by_time = [
-                    UserStats(
-                        username=row.get("user", ""),
-                        user_id=self._safe_int(row.get("user_id", 0)),
-                        friendly_name=row.get("friendly_name", row.get("user", "")),
-                        plays=self._safe_int(row.get("total_plays", 0)),
-                        watch_time=self._safe_int(row.get("total_duration", 0)),
+                    UserStats.model_construct(
+                        username=row.get("user") or "",
+                        user_id=_safe_int(row.get("user_id", 0)),
+                        friendly_name=row.get("friendly_name", row.get("user")) or "",
+                        plays=_safe_int(row.get("total_plays", 0)),
+                        watch_time=_safe_int(row.get("total_duration", 0)),
                         evolution_type="stable",
                     )
                     for row in rows[:5]
                 ]
                 # Calculate total watch time from all users (not just top 5)
-                stats.total_duration = sum(self._safe_int(row.get("total_duration", 0)) for row in rows)
-                stats.total_watch_time = stats.total_duration
+                stats.total_duration = sum(_safe_int(row.get("total_duration", 0)) for row in rows)
 
     async def _fetch_library_stats(self, stats: TautulliStatistics) -> None:
         """Fetch library media counts."""
@@ -641,23 +742,14 @@ class TautulliIntegration(BaseIntegration[MediaItem]):
 
         for lib in libraries:
             section_type = lib.get("section_type", "")
-            count = self._safe_int(lib.get("count", 0))
+            count = _safe_int(lib.get("count", 0))
 
             if section_type == "movie":
                 stats.library_total_movies += count
             elif section_type == "show":
                 stats.library_total_shows += count
                 # Child count is typically episodes
-                stats.library_total_episodes += self._safe_int(lib.get("child_count", 0))
-
-    def _safe_int(self, value: Any) -> int:
-        """Safely convert a value to int, handling strings and None."""
-        if value is None:
-            return 0
-        try:
-            return int(value)
-        except (ValueError, TypeError):
-            return 0
+                stats.library_total_episodes += _safe_int(lib.get("child_count", 0))
 
     async def _fetch_plays_by_date(self, stats: TautulliStatistics, days: int) -> None:
         """Fetch plays by date for totals and daily breakdown."""
@@ -675,41 +767,38 @@ class TautulliIntegration(BaseIntegration[MediaItem]):
         categories = plays_data.get("categories", [])
         series_data = plays_data.get("series", [])
 
-        logger.debug(f"Plays by date - categories: {len(categories)}, series: {len(series_data)}")
-        for serie in series_data:
-            logger.debug(f"  Serie: {serie.get('name')} with {len(serie.get('data', []))} data points")
-
-        daily_views: list[dict[str, Any]] = []
+        logger.debug("Plays by date - categories: %s, series: %s", len(categories), len(series_data))
 
-        # Process series data (TV and Movies)
-        # Tautulli returns library names, so we check for common patterns
-        for day_idx, day_label in enumerate(categories):
-            day_data = {"day": day_label, "movies": 0, "series": 0, "total": 0}
-
-            for serie in series_data:
-                serie_name = serie.get("name", "").lower()
-                data_points = serie.get("data", [])
-
-                if day_idx < len(data_points):
-                    count = self._safe_int(data_points[day_idx])
-                    # Check for movie libraries (Movies, Films, etc.)
-                    if any(keyword in serie_name for keyword in ["movie", "film", "movies", "films"]):
-                        day_data["movies"] += count
-                        stats.movies_plays += count
-                    # Check for TV libraries (TV, Shows, Series, etc.)
-                    elif any(keyword in serie_name for keyword in ["tv", "show", "serie", "séries", "series"]):
-                        day_data["series"] += count
-                        stats.series_plays += count
-                    else:
-                        # Unknown library type, add to total anyway
-                        logger.debug(f"Unknown library type: {serie_name}")
-                    day_data["total"] += count
-                    stats.total_plays += count
-
-            daily_views.append(day_data)
-
-        stats.daily_views_by_type = daily_views
-        logger.debug(f"Total plays calculated: {stats.total_plays}, movies: {stats.movies_plays}, series: {stats.series_plays}")
+        # Tautulli returns library names, so classify each library once
+        # (Movies/Films vs TV/Shows/Series) and group the series by kind
+        grouped: dict[str | None, list[dict[str, Any]]] = {"movies": [], "series": [], None: []}
+        for serie in series_data:
+            kind = _library_kind(serie.get("name", ""))
+            logger.debug(
+                "  Serie: %s (%s) with %s data points",
+                serie.get("name"), kind, len(serie.get("data", [])),
+            )
+            grouped[kind].append(serie)
+
+        # Reduce each group to per-day totals; unknown libraries only count in the total
+        num_days = len(categories)
+        movies_per_day = _sum_series(grouped["movies"], num_days)
+        series_per_day = _sum_series(grouped["series"], num_days)
+        other_per_day = _sum_series(grouped[None], num_days)
+
+        stats.daily_views_by_type = [
+            {"day": day, "movies": movies, "series": series, "total": movies + series + other}
+            for day, movies, series, other in zip(
+                categories, movies_per_day, series_per_day, other_per_day, strict=True
+            )
+        ]
+        stats.movies_plays = sum(movies_per_day)
+        stats.series_plays = sum(series_per_day)
+        stats.total_plays = stats.movies_plays + stats.series_plays + sum(other_per_day)
+        logger.debug(
+            "Total plays calculated: %s, movies: %s, series: %s",
+            stats.total_plays, stats.movies_plays, stats.series_plays,
+        )
 
     async def _fetch_plays_by_hour(self, stats: TautulliStatistics, days: int) -> None:
         """Fetch plays by hour of day."""
@@ -729,20 +818,15 @@ class TautulliIntegration(BaseIntegration[MediaItem]):
 
         plays_by_hour: dict[int, int] = {}
 
-        # Sum all series (Movies + TV) for each hour
+        # Sum all series (Movies + TV) for each hour in a single pass
+        totals = _sum_series(series_data, len(categories))
         for hour_idx, hour_label in enumerate(categories):
             try:
                 hour = int(hour_label)
             except ValueError:
                 hour = hour_idx
 
-            total_for_hour = 0
-            for serie in series_data:
-                data_points = serie.get("data", [])
-                if hour_idx < len(data_points):
-                    total_for_hour += self._safe_int(data_points[hour_idx])
-
-            plays_by_hour[hour] = total_for_hour
+            plays_by_hour[hour] = totals[hour_idx]
 
         stats.plays_by_hour = plays_by_hour
 
@@ -767,16 +851,10 @@ class TautulliIntegration(BaseIntegration[MediaItem]):
         # French day names for template
         day_names = ["Lundi", "Mardi", "Mercredi", "Jeudi", "Vendredi", "Samedi", "Dimanche"]
 
+        totals = _sum_series(series_data, len(categories))
         for day_idx, day_label in enumerate(categories):
             # Try to map to French day name
             day_name = day_names[day_idx] if day_idx < len(day_names) else day_label
-
-            total_for_day = 0
-            for serie in series_data:
-                data_points = serie.get("data", [])
-                if day_idx < len(data_points):
-                    total_for_day += self._safe_int(data_points[day_idx])
-
-            plays_by_weekday[day_name] = total_for_day
+            plays_by_weekday[day_name] = totals[day_idx]
 
         stats.plays_by_weekday = plays_by_weekday
@@ -1,15 +1,61 @@
 """TMDB integration for movie/TV metadata enrichment."""
 
+import asyncio
 import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 from pydantic import BaseModel
 
+from app.core.exceptions import IntegrationError
 from app.core.logging import get_logger
 from app.integrations.base import BaseIntegration
 
 logger = get_logger(__name__)
 
+# TMDB metadata is effectively static, so details are shared across
+# integration instances, keyed by (media_type, tmdb_id, language)
+DETAILS_CACHE_TTL = 3600  # seconds
+DETAILS_MISS_CACHE_TTL = 60  # seconds, for ids TMDB doesn't know
+DETAILS_CACHE_MAX_SIZE = 2048
+_details_cache: OrderedDict[tuple[str, int, str], tuple[float, "TMDBMetadata | None"]] = (
+    OrderedDict()
+)
+
+
+def _get_cached_details(key: tuple[str, int, str]) -> tuple[bool, "TMDBMetadata | None"]:
+    """Return (hit, metadata) for a details lookup."""
+    cached = _details_cache.get(key)
+    if cached is None:
+        return False, None
+    expires_at, metadata = cached
+    if time.monotonic() >= expires_at:
+        del _details_cache[key]
+        return False, None
+    _details_cache.move_to_end(key)
+    return True, metadata
+
+
+def _store_details(key: tuple[str, int, str], metadata: "TMDBMetadata | None") -> None:
+    """Cache a details lookup, evicting the least recently used entries."""
+    ttl = DETAILS_CACHE_TTL if metadata is not None else DETAILS_MISS_CACHE_TTL
+    _details_cache[key] = (time.monotonic() + ttl, metadata)
+    _details_cache.move_to_end(key)
+    while len(_details_cache) > DETAILS_CACHE_MAX_SIZE:
+        _details_cache.popitem(last=False)
+
+
+# Lookups currently in progress, so concurrent callers share one request
+_details_inflight: dict[tuple[str, int, str], "asyncio.Task[TMDBMetadata | None]"] = {}
+
+
+def _finish_details(key: tuple[str, int, str], task: "asyncio.Task[TMDBMetadata | None]") -> None:
+    """Cache a completed lookup and release its in-flight slot."""
+    _details_inflight.pop(key, None)
+    if not task.cancelled() and task.exception() is None:
+        _store_details(key, task.result())
+
 
 class TMDBMetadata(BaseModel):
     """Metadata from TMDB."""
@@ -47,10 +93,19 @@ class TMDBIntegration(BaseIntegration[TMDBMetadata]):
 
     SERVICE_NAME = "TMDB"
     BASE_URL = "https://api.themoviedb.org/3"
+    LANGUAGE = "fr-FR"
+    # enrich_media_batch fans out many lookups at once; stay well below
+    # TMDB's rate limit
+    MAX_CONCURRENT_REQUESTS = 8
 
     def __init__(self, url: str = "", api_key: str = ""):
         """Initialize TMDB integration."""
         super().__init__(url=self.BASE_URL, api_key=api_key)
+        # The key type and the query params derived from it are fixed per instance;
+        # bearer tokens (Read Access Token) are longer (200+ chars) and start with "ey"
+        self._bearer = len(self.api_key) > 100 and self.api_key.startswith("ey")
+        self._auth_params: dict[str, Any] = {} if self._bearer else {"api_key": self.api_key}
+        self._language_params = self._auth_params | {"language": self.LANGUAGE}
 
     @property
     def is_configured(self) -> bool:
@@ -60,8 +115,7 @@ class TMDBIntegration(BaseIntegration[TMDBMetadata]):
     @property
     def _is_bearer_token(self) -> bool:
         """Check if the API key is a Bearer token (Read Access Token) vs API Key v3."""
-        # Bearer tokens are longer (200+ chars) and start with "ey"
-        return len(self.api_key) > 100 and self.api_key.startswith("ey")
+        return self._bearer
 
     def _get_default_headers(self) -> dict[str, str]:
         headers = {
@@ -75,10 +129,7 @@ class TMDBIntegration(BaseIntegration[TMDBMetadata]):
 
     def _add_api_key_param(self, params: dict[str, Any] | None) -> dict[str, Any]:
         """Add API key to params if using v3 API key (not Bearer token)."""
-        params = params or {}
-        if not self._is_bearer_token:
-            params["api_key"] = self.api_key
-        return params
+        return self._auth_params | params if params else dict(self._auth_params)
 
     async def test_connection(self) -> tuple[bool, str, int | None]:
         """Test connection to TMDB."""
@@ -113,11 +164,11 @@ class TMDBIntegration(BaseIntegration[TMDBMetadata]):
             return None
 
         try:
-            params: dict[str, Any] = {"query": title, "language": "fr-FR"}
+            params = self._language_params | {"query": title}
             if year:
                 params["year"] = year
 
-            response = await self._request("GET", "/search/movie", params=self._add_api_key_param(params))
+            response = await self._request("GET", "/search/movie", params=params)
             results = response.get("results", [])
 
             if results:
@@ -135,11 +186,11 @@ class TMDBIntegration(BaseIntegration[TMDBMetadata]):
             return None
 
         try:
-            params: dict[str, Any] = {"query": title, "language": "fr-FR"}
+            params = self._language_params | {"query": title}
             if year:
                 params["first_air_date_year"] = year
 
-            response = await self._request("GET", "/search/tv", params=self._add_api_key_param(params))
+            response = await self._request("GET", "/search/tv", params=params)
             results = response.get("results", [])
 
             if results:
@@ -151,39 +202,70 @@ class TMDBIntegration(BaseIntegration[TMDBMetadata]):
 
         return None
 
+    async def _get_details(
+        self,
+        key: tuple[str, int, str],
+        fetch: Callable[[], Awaitable[TMDBMetadata | None]],
+    ) -> TMDBMetadata | None:
+        """Serve a details lookup from the cache, or share the request already in flight."""
+        hit, metadata = _get_cached_details(key)
+        if hit:
+            return metadata
+
+        task = _details_inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            _details_inflight[key] = task
+            task.add_done_callback(lambda done: _finish_details(key, done))
+        # Shield so a cancelled caller doesn't cancel the lookup for the others
+        return await asyncio.shield(task)
+
     async def get_movie_details(self, tmdb_id: int) -> TMDBMetadata | None:
         """Get detailed movie information."""
         if not self.is_configured:
             return None
 
         try:
-            response = await self._request(
-                "GET",
-                f"/movie/{tmdb_id}",
-                params=self._add_api_key_param({"language": "fr-FR"}),
+            return await self._get_details(
+                ("movie", tmdb_id, self.LANGUAGE), lambda: self._fetch_movie_details(tmdb_id)
             )
-
-            genres = [g["name"] for g in response.get("genres", [])]
-
-            return TMDBMetadata(
-                tmdb_id=response["id"],
-                title=response.get("title", ""),
-                original_title=response.get("original_title"),
-                overview=response.get("overview"),
-                poster_path=response.get("poster_path"),
-                backdrop_path=response.get("backdrop_path"),
-                release_date=response.get("release_date"),
-                vote_average=response.get("vote_average"),
-                vote_count=response.get("vote_count"),
-                genres=genres,
-                runtime=response.get("runtime"),
-                media_type="movie",
-            )
-
         except Exception as e:
             logger.error(f"Failed to get TMDB movie details: {e}")
+            return None
 
-        return None
+    async def _fetch_movie_details(self, tmdb_id: int) -> TMDBMetadata | None:
+        """Request movie details from TMDB.
+
+        Returns None only when TMDB doesn't know the id; other errors propagate
+        so a transient failure isn't cached as a miss.
+        """
+        try:
+            response = await self._request(
+                "GET",
+                f"/movie/{tmdb_id}",
+                params=self._language_params,
+            )
+        except IntegrationError as e:
+            if e.details.get("status_code") == 404:
+                return None
+            raise
+
+        genres = [g["name"] for g in response.get("genres", [])]
+
+        return TMDBMetadata(
+            tmdb_id=response["id"],
+            title=response.get("title", ""),
+            original_title=response.get("original_title"),
+            overview=response.get("overview"),
+            poster_path=response.get("poster_path"),
+            backdrop_path=response.get("backdrop_path"),
+            release_date=response.get("release_date"),
+            vote_average=response.get("vote_average"),
+            vote_count=response.get("vote_count"),
+            genres=genres,
+            runtime=response.get("runtime"),
+            media_type="movie",
+        )
 
     async def get_tv_details(self, tmdb_id: int) -> TMDBMetadata | None:
         """Get detailed TV show information."""
@@ -191,34 +273,47 @@ class TMDBIntegration(BaseIntegration[TMDBMetadata]):
             return None
 
         try:
-            response = await self._request(
-                "GET",
-                f"/tv/{tmdb_id}",
-                params=self._add_api_key_param({"language": "fr-FR"}),
+            return await self._get_details(
+                ("tv", tmdb_id, self.LANGUAGE), lambda: self._fetch_tv_details(tmdb_id)
             )
-
-            genres = [g["name"] for g in response.get("genres", [])]
-            episode_runtime = response.get("episode_run_time", [])
-
-            return TMDBMetadata(
-                tmdb_id=response["id"],
-                title=response.get("name", ""),
-                original_title=response.get("original_name"),
-                overview=response.get("overview"),
-                poster_path=response.get("poster_path"),
-                backdrop_path=response.get("backdrop_path"),
-                release_date=response.get("first_air_date"),
-                vote_average=response.get("vote_average"),
-                vote_count=response.get("vote_count"),
-                genres=genres,
-                runtime=episode_runtime[0] if episode_runtime else None,
-                media_type="tv",
-            )
-
         except Exception as e:
             logger.error(f"Failed to get TMDB TV details: {e}")
+            return None
 
-        return None
+    async def _fetch_tv_details(self, tmdb_id: int) -> TMDBMetadata | None:
+        """Request TV show details from TMDB.
+
+        Returns None only when TMDB doesn't know the id; other errors propagate
+        so a transient failure isn't cached as a miss.
+        """
+        try:
+            response = await self._request(
+                "GET",
+                f"/tv/{tmdb_id}",
+                params=self._language_params,
+            )
+        except IntegrationError as e:
+            if e.details.get("status_code") == 404:
+                return None
+            raise
+
+        genres = [g["name"] for g in response.get("genres", [])]
+        episode_runtime = response.get("episode_run_time", [])
+
+        return TMDBMetadata(
+            tmdb_id=response["id"],
+            title=response.get("name", ""),
+            original_title=response.get("original_name"),
+            overview=response.get("overview"),
+            poster_path=response.get("poster_path"),
+            backdrop_path=response.get("backdrop_path"),
+            release_date=response.get("first_air_date"),
+            vote_average=response.get("vote_average"),
+            vote_count=response.get("vote_count"),
+            genres=genres,
+            runtime=episode_runtime[0] if episode_runtime else None,
+            media_type="tv",
+        )
 
     async def enrich_media(
         self,
@@ -243,3 +338,20 @@ class TMDBIntegration(BaseIntegration[TMDBMetadata]):
             return await self.search_movie(title, year)
         else:
             return await self.search_tv(title, year)
+
+    async def enrich_media_batch(
+        self,
+        specs: list[tuple[str, str, int | None, int | None]],
+    ) -> list[TMDBMetadata | None]:
+        """Enrich several media items concurrently.
+
+        Args:
+            specs: (title, media_type, year, tmdb_id) tuples, as for enrich_media
+
+        Returns:
+            Metadata (or None) for each spec, in the same order
+        """
+        if not self.is_configured or not specs:
+            return [None] * len(specs)
+
+        return await asyncio.gather(*(self.enrich_media(*spec) for spec in specs))
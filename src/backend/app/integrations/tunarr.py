@@ -1,7 +1,11 @@
 """Tunarr integration for TV programming."""
 
+import asyncio
+import math
+import random
 import time
 from datetime import datetime, timedelta
+from operator import attrgetter
 from typing import Any
 
 from pydantic import BaseModel
@@ -11,6 +15,21 @@ from app.integrations.base import BaseIntegration
 
 logger = get_logger(__name__)
 
+# The channel list rarely changes: share it across integration instances per Tunarr URL
+CHANNELS_CACHE_TTL = 60  # seconds
+_channels_cache: dict[str, tuple[float, list["TunarrChannel"]]] = {}
+# One lock per Tunarr URL, so refreshing one server doesn't wait on another
+_channels_locks: dict[str, asyncio.Lock] = {}
+
+# Schedules only change when channels are reprogrammed, so a generated
+# schedule is reused (e.g. a preview followed by the actual generation)
+SCHEDULE_CACHE_TTL = 300  # seconds
+# key -> (stored at, seconds it took to build, programs)
+_schedule_cache: dict[tuple[Any, ...], tuple[float, float, list["ProgramItem"]]] = {}
+
+# Programs are returned in schedule order
+_PROGRAM_ORDER = attrgetter("start_time", "channel_name")
+
 
 class TunarrChannel(BaseModel):
     """Channel from Tunarr."""
@@ -41,6 +60,8 @@ class TunarrIntegration(BaseIntegration[ProgramItem]):
     """Integration with Tunarr for TV programming."""
 
     SERVICE_NAME = "Tunarr"
+    # fetch_data requests every channel's programming at once
+    MAX_CONCURRENT_REQUESTS = 8
 
     @property
     def is_configured(self) -> bool:
@@ -80,40 +101,60 @@ class TunarrIntegration(BaseIntegration[ProgramItem]):
             logger.error(f"Tunarr connection test failed: {e}")
             return False, str(e), None
 
-    async def get_channels(self) -> list[TunarrChannel]:
-        """Get available channels from Tunarr."""
+    async def get_channels(self, use_cache: bool = True) -> list[TunarrChannel]:
+        """Get available channels from Tunarr.
+
+        Args:
+            use_cache: Reuse a recent result for the same server. Pass False
+                where the list is shown to the user, so it is never stale.
+        """
         if not self.is_configured:
             return []
 
-        try:
-            response = await self._request("GET", "/api/channels")
+        if use_cache:
+            cached = _channels_cache.get(self.url)
+            if cached and time.monotonic() - cached[0] < CHANNELS_CACHE_TTL:
+                return list(cached[1])
 
-            channels = []
-            for ch in response:
-                # Handle icon field - can be a string or a dict with 'path' key
-                icon = ch.get("icon")
-                if isinstance(icon, dict):
-                    icon_url = icon.get("path")
-                elif isinstance(icon, str):
-                    icon_url = icon
-                else:
-                    icon_url = None
-
-                channels.append(
-                    TunarrChannel(
-                        id=ch.get("id", ""),
-                        number=ch.get("number", 0),
-                        name=ch.get("name", "Unknown"),
-                        icon_url=icon_url,
-                        group=ch.get("groupTitle"),
+        # Serialize refreshes so concurrent callers don't all refetch the list
+        async with _channels_locks.setdefault(self.url, asyncio.Lock()):
+            if use_cache:
+                cached = _channels_cache.get(self.url)
+                if cached and time.monotonic() - cached[0] < CHANNELS_CACHE_TTL:
+                    return list(cached[1])
+
+            try:
+                response = await self._request("GET", "/api/channels")
+
+                channels = []
+                for ch in response:
+                    # Handle icon field - can be a string or a dict with 'path' key
+                    icon = ch.get("icon")
+                    if isinstance(icon, dict):
+                        icon_url = icon.get("path")
+                    elif isinstance(icon, str):
+                        icon_url = icon
+                    else:
+                        icon_url = None
+
+                    # Fields are normalized here, so skip pydantic validation
+                    channels.append(
+                        TunarrChannel.model_construct(
+                            id=ch.get("id") or "",
+                            number=ch.get("number") or 0,
+                            name=ch.get("name") or "Unknown",
+                            icon_url=icon_url,
+                            group=ch.get("groupTitle"),
+                        )
                     )
-                )
 
-            return sorted(channels, key=lambda c: c.number)
+                channels.sort(key=attrgetter("number"))
+                _channels_cache[self.url] = (time.monotonic(), channels)
+                return list(channels)
 
-        except Exception as e:
-            logger.error(f"Failed to fetch Tunarr channels: {e}")
-            return []
+            except Exception as e:
+                logger.error(f"Failed to fetch Tunarr channels: {e}")
+                return []
 
     async def fetch_data(
         self,
@@ -126,48 +167,74 @@ class TunarrIntegration(BaseIntegration[ProgramItem]):
         if not self.is_configured:
             return []
 
+        cache_key = (self.url, days, max_items, tuple(channels or ()))
+        now = time.monotonic()
+        cached = _schedule_cache.get(cache_key)
+        if cached:
+            stored_at, build_time, items = cached
+            # Probabilistic early expiration (XFetch): the closer the entry is
+            # to expiring and the slower it was to build, the likelier one
+            # caller refreshes it ahead of time, so callers don't all miss at once
+            if now - build_time * math.log(1.0 - random.random()) < stored_at + SCHEDULE_CACHE_TTL:
+                return list(items)
+
+        items, complete = await self._fetch_schedule(days, max_items, channels)
+
+        # Only cache complete schedules so a failed channel is retried
+        if complete and items:
+            for stale_key in [
+                k for k, (ts, _, _) in _schedule_cache.items() if now - ts >= SCHEDULE_CACHE_TTL
+            ]:
+                del _schedule_cache[stale_key]
+            _schedule_cache[cache_key] = (now, time.monotonic() - now, items)
+
+        return list(items)
+
+    async def _fetch_schedule(
+        self,
+        days: int,
+        max_items: int,
+        channels: list[str] | None,
+    ) -> tuple[list[ProgramItem], bool]:
+        """Build the programming schedule; also reports whether every channel was fetched."""
         items: list[ProgramItem] = []
+        failed = False
         start_time = datetime.now()
         end_time = start_time + timedelta(days=days)
 
         try:
+            # One channel list serves both the name lookup and the default selection
+            all_channels = await self.get_channels()
+            channel_map = {ch.id: ch.name for ch in all_channels}
+
             # Get all channels if none specified
             if not channels:
-                all_channels = await self.get_channels()
                 channels = [ch.id for ch in all_channels]
 
-            channel_map: dict[str, str] = {}
-            all_channels = await self.get_channels()
-            for ch in all_channels:
-                channel_map[ch.id] = ch.name
-
-            # First, try to get the guide/schedule data
-            # Tunarr uses Unix timestamps in milliseconds for the guide
-            int(start_time.timestamp() * 1000)
-            int(end_time.timestamp() * 1000)
-
-            try:
-                # Try the guide endpoint with channel filter
-                logger.info(f"Fetching guide for channels from {start_time} to {end_time}")
-                guide_response = await self._request(
-                    "GET",
-                    "/api/guide/debug",
-                )
-                logger.info(f"Guide debug response: type={type(guide_response).__name__}, keys={guide_response.keys() if isinstance(guide_response, dict) else 'N/A'}")
-                logger.info(f"Guide debug content: {str(guide_response)[:1000]}")
-            except Exception as e:
-                logger.warning(f"Guide debug failed: {e}")
-
-            for channel_id in channels:
-                try:
-                    # Use programming endpoint and extract schedule from there
-                    logger.info(f"Fetching programming for channel {channel_id}")
-                    response = await self._request(
-                        "GET",
-                        f"/api/channels/{channel_id}/programming",
+            # get_channels returns [] on failure; programs of channels missing
+            # from the list would be named "Unknown", so don't cache that schedule
+            if not all_channels or any(cid not in channel_map for cid in channels):
+                failed = True
+
+            # Use programming endpoint and extract schedule from there; channels
+            # are independent, so request them all concurrently
+            logger.debug("Fetching programming for %s channels", len(channels))
+            responses = await asyncio.gather(
+                *(self._request("GET", f"/api/channels/{cid}/programming") for cid in channels),
+                return_exceptions=True,
+            )
+
+            for channel_id, response in zip(channels, responses, strict=True):
+                if isinstance(response, Exception):
+                    failed = True
+                    logger.warning(
+                        "Failed to fetch schedule for channel %s: %s: %s",
+                        channel_id, type(response).__name__, response,
                     )
+                    continue
 
-                    logger.info(f"Tunarr programming response: type={type(response).__name__}")
+                try:
+                    logger.debug("Tunarr programming response: type=%s", type(response).__name__)
 
                     # The programming endpoint returns channel info with programs dict
                     programs_data = response.get("programs", {}) if isinstance(response, dict) else {}
@@ -178,82 +245,100 @@ class TunarrIntegration(BaseIntegration[ProgramItem]):
                     else:
                         programs = programs_data if isinstance(programs_data, list) else []
 
-                    logger.info(f"Found {len(programs)} programs for channel {channel_id}")
-
-                    if programs:
-                        logger.info(f"First program keys: {list(programs[0].keys())}")
+                    logger.debug("Found %s programs for channel %s", len(programs), channel_id)
 
                     # Calculate total cycle duration (sum of all program durations)
                     cycle_duration_ms = sum(p.get("duration", 0) for p in programs)
                     if cycle_duration_ms == 0:
                         continue
 
-                    logger.info(f"Channel {channel_id} cycle duration: {cycle_duration_ms / 1000 / 60 / 60:.1f} hours")
+                    logger.debug(
+                        "Channel %s cycle duration: %.1f hours",
+                        channel_id, cycle_duration_ms / 3_600_000,
+                    )
 
-                    # Loop through the schedule, repeating programs until we fill the time range
-                    current_time = start_time
-                    iteration = 0
+                    # Program fields don't change between repeats of the cycle,
+                    # so resolve them once per program instead of per occurrence
+                    channel_name = channel_map.get(channel_id, "Unknown")
+                    schedule: list[tuple[int, int, str, str, str | None, str | None, str]] = []
+                    for prog in programs:
+                        duration_ms = prog.get("duration", 0)
+                        if not duration_ms:
+                            continue
+
+                        # Handle icon field - can be a string or a dict with 'path' key
+                        icon = prog.get("icon") or prog.get("thumbnail")
+                        if isinstance(icon, dict):
+                            thumbnail_url = icon.get("path")
+                        elif isinstance(icon, str):
+                            thumbnail_url = icon
+                        else:
+                            thumbnail_url = None
+
+                        schedule.append((
+                            duration_ms,
+                            int(duration_ms / 1000 / 60),  # Convert ms to minutes
+                            prog.get("id") or prog.get("uniqueId", "prog"),
+                            prog.get("title") or prog.get("name") or "Unknown",
+                            prog.get("summary") or prog.get("description"),
+                            thumbnail_url,
+                            prog.get("subtype") or prog.get("type") or "program",
+                        ))
+
+                    # Repeat the cycle until we fill the time range, tracking the
+                    # position as a millisecond offset from start_time
+                    window_ms = (end_time - start_time) / timedelta(milliseconds=1)
+                    offset_ms = 0
+                    prog_start = start_time
                     max_iterations = 100  # Safety limit
+                    check_max = max_items != -1
 
-                    while current_time < end_time and iteration < max_iterations:
-                        iteration += 1
-
-                        for prog in programs:
-                            # Get duration in milliseconds
-                            duration_ms = prog.get("duration", 0)
-                            if not duration_ms:
-                                continue
-
-                            # Calculate start and end times based on current position
-                            prog_start = current_time
-                            duration = int(duration_ms / 1000 / 60)  # Convert ms to minutes
-                            prog_end = prog_start + timedelta(milliseconds=duration_ms)
-
-                            # Move current time forward
-                            current_time = prog_end
-
-                            # Skip programs that end before our start time
-                            if prog_end < start_time:
-                                continue
-
+                    for iteration in range(1, max_iterations + 1):
+                        for (
+                            duration_ms, duration, prog_id, title, description, thumbnail_url, prog_type
+                        ) in schedule:
                             # Stop if we've passed the end time
-                            if prog_start > end_time:
+                            if offset_ms > window_ms:
                                 break
 
-                            # Handle icon field - can be a string or a dict with 'path' key
-                            icon = prog.get("icon") or prog.get("thumbnail")
-                            if isinstance(icon, dict):
-                                thumbnail_url = icon.get("path")
-                            elif isinstance(icon, str):
-                                thumbnail_url = icon
-                            else:
-                                thumbnail_url = None
-
-                            program = ProgramItem(
-                                id=f"{prog.get('id') or prog.get('uniqueId', 'prog')}_{iteration}_{prog_start.timestamp()}",
-                                title=prog.get("title") or prog.get("name", "Unknown"),
+                            offset_ms += duration_ms
+                            prog_end = start_time + timedelta(milliseconds=offset_ms)
+
+                            # Fields are normalized above, so skip pydantic validation
+                            program = ProgramItem.model_construct(
+                                id=f"{prog_id}_{iteration}_{prog_start.timestamp()}",
+                                title=title,
                                 start_time=prog_start,
                                 end_time=prog_end,
                                 duration=duration,
                                 channel_id=channel_id,
-                                channel_name=channel_map.get(channel_id, "Unknown"),
-                                description=prog.get("summary") or prog.get("description"),
+                                channel_name=channel_name,
+                                description=description,
                                 thumbnail_url=thumbnail_url,
-                                type=prog.get("subtype") or prog.get("type", "program"),
+                                type=prog_type,
                             )
                             items.append(program)
 
-                            if max_items != -1 and len(items) >= max_items:
-                                return items
+                            if check_max and len(items) >= max_items:
+                                return sorted(items, key=_PROGRAM_ORDER), not failed
+
+                            # The next program starts when this one ends
+                            prog_start = prog_end
 
                         # Check if we've passed the end time after completing a cycle
-                        if current_time >= end_time:
+                        if offset_ms >= window_ms:
                             break
 
                 except Exception as e:
-                    logger.warning(f"Failed to fetch schedule for channel {channel_id}: {type(e).__name__}: {e}")
+                    failed = True
+                    logger.warning(
+                        "Failed to fetch schedule for channel %s: %s: %s",
+                        channel_id, type(e).__name__, e,
+                    )
 
         except Exception as e:
+            failed = True
             logger.error(f"Failed to fetch Tunarr data: {e}")
 
-        return sorted(items, key=lambda p: (p.start_time, p.channel_name))
+        # Each channel's programs are already chronological; Timsort merges those runs
+        return sorted(items, key=_PROGRAM_ORDER), not failed
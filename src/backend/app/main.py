@@ -263,6 +263,13 @@ async def lifespan(app: FastAPI):
     await stop_scheduler()
     logger.info("Scheduler stopped")
 
+    # Close the shared Ghost client and the integrations connection pool
+    from app.integrations.base import close_shared_transport
+    from app.integrations.ghost import ghost_client
+
+    await ghost_client.close()
+    await close_shared_transport()
+
     # Stop database logging handler
     stop_db_logging()
 
@@ -4,7 +4,18 @@ import enum
 from datetime import datetime
 from uuid import uuid4
 
-from sqlalchemy import JSON, Column, DateTime, Enum, Float, ForeignKey, Integer, String, Text
+from sqlalchemy import (
+    JSON,
+    Column,
+    DateTime,
+    Enum,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+)
 from sqlalchemy.orm import relationship
 
 from app.database import Base
@@ -32,12 +43,16 @@ class History(Base):
     """Generation history with full audit trail."""
 
     __tablename__ = "history"
+    __table_args__ = (
+        # History list filters by status and lists newest first
+        Index("ix_history_status_created_at", "status", "created_at"),
+    )
 
     id = Column(String(36), primary_key=True, default=lambda: str(uuid4()))
     type = Column(Enum(GenerationType), nullable=False, index=True)
     schedule_id = Column(String(36), ForeignKey("schedules.id"), nullable=True)
     template_id = Column(String(36), ForeignKey("templates.id"), nullable=True)
-    status = Column(Enum(GenerationStatus), default=GenerationStatus.PENDING, index=True)
+    status = Column(Enum(GenerationStatus), default=GenerationStatus.PENDING)
     ghost_post_id = Column(String(100), nullable=True)
     ghost_post_url = Column(String(512), nullable=True)
     generation_config = Column(JSON, nullable=True)  # Nullable for deletion entries
@@ -4,7 +4,7 @@ import enum
 from datetime import datetime
 from uuid import uuid4
 
-from sqlalchemy import JSON, Column, DateTime, Enum, String, Text
+from sqlalchemy import JSON, Column, DateTime, Enum, Index, String, Text
 
 from app.database import Base
 
@@ -30,9 +30,13 @@ class Log(Base):
     """System log entry for diagnostics."""
 
     __tablename__ = "logs"
+    __table_args__ = (
+        # Log viewer filters by level/source and lists newest first
+        Index("ix_logs_level_source_created_at", "level", "source", "created_at"),
+    )
 
     id = Column(String(36), primary_key=True, default=lambda: str(uuid4()))
-    level = Column(Enum(LogLevel), nullable=False, index=True)
+    level = Column(Enum(LogLevel), nullable=False)
     source = Column(Enum(LogSource), nullable=False, index=True)
     service = Column(String(50), nullable=True, index=True)  # "tautulli", "ghost", etc.
     message = Column(Text, nullable=False)
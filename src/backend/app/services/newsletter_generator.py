@@ -589,13 +589,21 @@ class NewsletterGenerator:
             integration = TMDBIntegration(api_key=api_key)
             enriched_count = 0
 
+            # Series are enriched once per show name
+            shows: dict[str, dict[str, Any]] = {}
+            for episode in self.series:
+                shows.setdefault(episode.get("grandparent_title", episode["title"]), episode)
+
+            # Look up movies and shows concurrently
+            results = await integration.enrich_media_batch(
+                [(movie["title"], "movie", movie.get("year"), None) for movie in self.movies]
+                + [(show_name, "tv", None, None) for show_name in shows]
+            )
+            movie_results = results[: len(self.movies)]
+            show_results = results[len(self.movies) :]
+
             # Enrich movies
-            for movie in self.movies:
-                metadata = await integration.enrich_media(
-                    title=movie["title"],
-                    media_type="movie",
-                    year=movie.get("year"),
-                )
+            for movie, metadata in zip(self.movies, movie_results, strict=True):
                 if metadata:
                     movie.update({
                         "tmdb_id": metadata.tmdb_id,
@@ -609,17 +617,7 @@ class NewsletterGenerator:
                     enriched_count += 1
 
             # Enrich series (by show name)
-            seen_shows = set()
-            for episode in self.series:
-                show_name = episode.get("grandparent_title", episode["title"])
-                if show_name in seen_shows:
-                    continue
-                seen_shows.add(show_name)
-
-                metadata = await integration.enrich_media(
-                    title=show_name,
-                    media_type="tv",
-                )
+            for episode, metadata in zip(shows.values(), show_results, strict=True):
                 if metadata:
                     episode.update({
                         "show_overview": metadata.overview,
@@ -976,33 +974,25 @@ class NewsletterGenerator:
 
             integration = TMDBIntegration(api_key=api_key)
 
-            # Enrich top movies
-            if self.statistics.get("top_movies_played"):
-                for movie in self.statistics["top_movies_played"]:
-                    if isinstance(movie, dict):
-                        metadata = await integration.enrich_media(
-                            title=movie.get("title", ""),
-                            media_type="movie",
-                        )
-                        if metadata:
-                            movie["poster_url"] = metadata.poster_url or ""
-                            movie["backdrop_url"] = metadata.backdrop_url or ""
-                            movie["rating"] = str(metadata.vote_average or "")
-                            movie["year"] = (metadata.release_date or "")[:4] if metadata.release_date else ""
-
-            # Enrich top shows
-            if self.statistics.get("top_shows_played"):
-                for show in self.statistics["top_shows_played"]:
-                    if isinstance(show, dict):
-                        metadata = await integration.enrich_media(
-                            title=show.get("title", ""),
-                            media_type="tv",
-                        )
-                        if metadata:
-                            show["poster_url"] = metadata.poster_url or ""
-                            show["backdrop_url"] = metadata.backdrop_url or ""
-                            show["rating"] = str(metadata.vote_average or "")
-                            show["year"] = (metadata.release_date or "")[:4] if metadata.release_date else ""
+            top_movies = [
+                m for m in self.statistics.get("top_movies_played") or [] if isinstance(m, dict)
+            ]
+            top_shows = [
+                s for s in self.statistics.get("top_shows_played") or [] if isinstance(s, dict)
+            ]
+
+            # Look up top movies and shows concurrently
+            results = await integration.enrich_media_batch(
+                [(movie.get("title", ""), "movie", None, None) for movie in top_movies]
+                + [(show.get("title", ""), "tv", None, None) for show in top_shows]
+            )
+
+            for item, metadata in zip(top_movies + top_shows, results, strict=True):
+                if metadata:
+                    item["poster_url"] = metadata.poster_url or ""
+                    item["backdrop_url"] = metadata.backdrop_url or ""
+                    item["rating"] = str(metadata.vote_average or "")
+                    item["year"] = (metadata.release_date or "")[:4] if metadata.release_date else ""
 
             await integration.close()
             logger.debug("Statistics enriched with TMDB data")
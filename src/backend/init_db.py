@@ -23,7 +23,7 @@ if not DATABASE_URL:
 SYNC_DATABASE_URL = DATABASE_URL.replace("+aiosqlite", "")
 
 # Current alembic head version
-ALEMBIC_HEAD = "001_add_scheduled_deletion"
+ALEMBIC_HEAD = "002_add_log_history_indexes"
 
 
 def stamp_alembic(engine):
@@ -45,9 +45,15 @@ def stamp_alembic(engine):
 def check_schema_up_to_date(inspector):
     """Check if schema has all columns from latest migration."""
     # Check if schedules table has schedule_type column (added in migration 001)
-    if "schedules" in inspector.get_table_names():
-        columns = [col["name"] for col in inspector.get_columns("schedules")]
-        if "schedule_type" in columns:
+    if "schedules" not in inspector.get_table_names():
+        return False
+    columns = [col["name"] for col in inspector.get_columns("schedules")]
+    if "schedule_type" not in columns:
+        return False
+    # Check if logs table has the composite index (added in migration 002)
+    if "logs" in inspector.get_table_names():
+        indexes = {index["name"] for index in inspector.get_indexes("logs")}
+        if "ix_logs_level_source_created_at" in indexes:
             return True
     return False
 
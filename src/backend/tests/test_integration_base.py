@@ -0,0 +1,50 @@
+"""Base integration HTTP client tests."""
+
+import httpcore
+import httpx
+
+from app.integrations import base
+from app.integrations.tautulli import TautulliIntegration
+
+PROXY_VARS = ("HTTP_PROXY", "HTTPS_PROXY", "ALL_PROXY", "NO_PROXY")
+
+
+def _clear_proxy_env(monkeypatch) -> None:
+    for name in PROXY_VARS:
+        monkeypatch.delenv(name, raising=False)
+        monkeypatch.delenv(name.lower(), raising=False)
+
+
+async def _transport_for(url: str) -> httpx.AsyncBaseTransport:
+    integration = TautulliIntegration(url="https://tautulli.test", api_key="key")
+    client = await integration._get_client()
+    try:
+        return client._transport_for_url(httpx.URL(url))
+    finally:
+        await integration.close()
+
+
+async def test_https_proxy_from_environment(monkeypatch):
+    """HTTPS_PROXY routes requests through a shared proxy pool; NO_PROXY hosts go direct."""
+    _clear_proxy_env(monkeypatch)
+    monkeypatch.setenv("HTTPS_PROXY", "http://proxy.test:3128")
+    monkeypatch.setenv("NO_PROXY", "local.test")
+
+    proxied = await _transport_for("https://tautulli.test/api/v2")
+    assert isinstance(proxied, base._SharedTransport)
+    assert isinstance(proxied._pool, httpcore.AsyncHTTPProxy)
+    assert proxied is base._get_shared_transport("http://proxy.test:3128")
+
+    assert await _transport_for("https://local.test/api/v2") is base._get_shared_transport()
+    assert await _transport_for("http://tautulli.test/api/v2") is base._get_shared_transport()
+    await base.close_shared_transport()
+
+
+async def test_no_proxy_environment_uses_direct_pool(monkeypatch):
+    """Without proxy variables every request uses the direct shared pool."""
+    _clear_proxy_env(monkeypatch)
+
+    transport = await _transport_for("https://tautulli.test/api/v2")
+    assert transport is base._get_shared_transport()
+    assert not isinstance(transport._pool, httpcore.AsyncHTTPProxy)
+    await base.close_shared_transport()
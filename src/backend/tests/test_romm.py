@@ -0,0 +1,71 @@
+"""ROMM integration tests."""
+
+from datetime import datetime, timedelta
+from typing import Any
+
+from app.integrations import romm
+from app.integrations.romm import ROMMIntegration
+
+
+def _rom(rom_id: int, **dates: datetime) -> dict[str, Any]:
+    return {"id": rom_id, "name": f"Game {rom_id}", **{k: v.isoformat() for k, v in dates.items()}}
+
+
+def _integration(monkeypatch, pages: list[Any]) -> tuple[ROMMIntegration, list[dict[str, Any]]]:
+    """Build an integration whose /api/roms requests are answered from pages, in order."""
+    romm._platforms_cache.clear()
+    integration = ROMMIntegration(url="http://romm.test", api_key="key")
+    calls: list[dict[str, Any]] = []
+
+    async def request(method, path, params=None, **kwargs):
+        if path == "/api/platforms":
+            return []
+        calls.append(dict(params))
+        return pages[len(calls) - 1]
+
+    monkeypatch.setattr(integration, "_request", request)
+    return integration, calls
+
+
+async def test_old_updated_at_does_not_end_scan(monkeypatch):
+    """Only created_at ends the scan; an old updated_at just skips that ROM."""
+    now = datetime.now()
+    old = now - timedelta(days=30)
+    roms = [
+        _rom(1, created_at=now),
+        _rom(2, updated_at=old),
+        _rom(3, created_at=now - timedelta(days=1)),
+        _rom(4, created_at=old),
+        _rom(5, created_at=now),
+    ]
+    integration, _ = _integration(monkeypatch, [{"items": roms, "total": len(roms)}])
+
+    items = await integration.fetch_data(days=7)
+
+    assert [item.id for item in items] == [1, 3]
+
+
+async def test_pages_without_total(monkeypatch):
+    """A paginated response without a total keeps paging until a short page."""
+    monkeypatch.setattr(ROMMIntegration, "PAGE_SIZE", 2)
+    now = datetime.now()
+    pages = [
+        {"items": [_rom(1, created_at=now), _rom(2, created_at=now)]},
+        {"items": [_rom(3, created_at=now), _rom(4, created_at=now)]},
+        {"items": [_rom(5, created_at=now)]},
+    ]
+    integration, calls = _integration(monkeypatch, pages)
+
+    items = await integration.fetch_data(days=7)
+
+    assert [item.id for item in items] == [1, 2, 3, 4, 5]
+    assert [call["offset"] for call in calls] == [0, 2, 4]
+
+
+def test_iso_dates_are_local_time():
+    """ISO timestamps with an offset match the local time used for epoch dates."""
+    epoch = 1_700_000_000
+    parsed = romm._parse_game_date("2023-11-14T22:13:20Z", "Game")
+
+    assert parsed == datetime.fromtimestamp(epoch)
+    assert parsed.tzinfo is None
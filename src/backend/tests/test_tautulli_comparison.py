@@ -0,0 +1,107 @@
+"""Tautulli period comparison tests."""
+
+from datetime import date, timedelta
+from typing import Any
+
+from app.integrations import tautulli
+from app.integrations.tautulli import TautulliIntegration
+
+USERS = [f"user{i}" for i in range(20)]
+PLAY_DURATION = 600  # seconds
+
+
+def _success(data: Any) -> dict[str, Any]:
+    return {"response": {"result": "success", "data": data}}
+
+
+async def _stub_request(
+    method: str, path: str, params: dict[str, Any] | None = None, **kwargs: Any
+) -> dict[str, Any]:
+    """Answer every command with the same activity: one play per user in each period."""
+    cmd = params["cmd"]
+    if cmd == "get_home_stats":
+        # Tautulli caps top_users at stats_count rows
+        rows = [
+            {"user": user, "friendly_name": user, "total_plays": 1, "total_duration": PLAY_DURATION}
+            for user in USERS[: params["stats_count"]]
+        ]
+        return _success([{"stat_id": "top_users", "rows": rows}])
+    if cmd == "get_plays_by_date":
+        return _success(
+            {"categories": ["day"], "series": [{"name": "Movies", "data": [len(USERS)]}]}
+        )
+    if cmd == "get_history":
+        records = [
+            {
+                "friendly_name": user,
+                "media_type": "movie",
+                "title": f"Movie {i}",
+                "play_duration": PLAY_DURATION,
+            }
+            for i, user in enumerate(USERS)
+        ]
+        start, length = params["start"], params["length"]
+        return _success({"recordsFiltered": len(records), "data": records[start : start + length]})
+    if cmd == "get_libraries":
+        return _success([])
+    return _success({})
+
+
+async def test_comparison_is_like_for_like(monkeypatch):
+    """Identical activity in both periods reports no growth."""
+    tautulli._statistics_cache.clear()
+    integration = TautulliIntegration(url="http://tautulli.test", api_key="key")
+    monkeypatch.setattr(integration, "_request", _stub_request)
+
+    stats = await integration.fetch_statistics(days=7, include_comparison=True)
+
+    assert stats.total_plays == stats.previous_total_plays == len(USERS)
+    assert stats.unique_users == stats.previous_unique_users == 10
+    assert stats.total_watch_time == stats.previous_total_watch_time == 10 * PLAY_DURATION
+    assert stats.plays_growth_percentage == 0.0
+    assert stats.time_growth_percentage == 0.0
+    assert stats.users_growth_percentage == 0.0
+
+
+async def test_failed_previous_period_skips_comparison(monkeypatch):
+    """A failed history lookup leaves the comparison empty and is not cached."""
+    tautulli._statistics_cache.clear()
+    integration = TautulliIntegration(url="http://tautulli.test", api_key="key")
+
+    async def failing_history(method, path, params=None, **kwargs):
+        if params["cmd"] == "get_history":
+            return {"response": {"result": "error", "data": {}}}
+        return await _stub_request(method, path, params=params, **kwargs)
+
+    monkeypatch.setattr(integration, "_request", failing_history)
+
+    stats = await integration.fetch_statistics(days=7, include_comparison=True)
+
+    assert stats.total_plays == len(USERS)
+    assert stats.previous_total_plays == 0
+    assert stats.plays_growth_percentage == 0.0
+    assert not tautulli._statistics_cache
+
+
+async def test_previous_period_history_is_capped(monkeypatch):
+    """A large previous period reads at most HISTORY_MAX_RECORDS rows over `days` days."""
+    tautulli._statistics_cache.clear()
+    integration = TautulliIntegration(url="http://tautulli.test", api_key="key")
+    history_calls: list[dict[str, Any]] = []
+
+    async def large_history(method, path, params=None, **kwargs):
+        if params["cmd"] == "get_history":
+            history_calls.append(dict(params))
+            rows = [{"friendly_name": "user", "media_type": "movie", "title": "Movie"}]
+            return _success({"recordsFiltered": 100_000, "data": rows * params["length"]})
+        return await _stub_request(method, path, params=params, **kwargs)
+
+    monkeypatch.setattr(integration, "_request", large_history)
+
+    stats = await integration.fetch_statistics(days=7, include_comparison=True)
+
+    assert stats.previous_total_plays == 100_000
+    assert sum(call["length"] for call in history_calls) == TautulliIntegration.HISTORY_MAX_RECORDS
+    today = date.today()
+    assert history_calls[0]["before"] == (today - timedelta(days=8)).isoformat()
+    assert history_calls[0]["after"] == (today - timedelta(days=14)).isoformat()